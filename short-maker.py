@@ -17,77 +17,117 @@ Windows Setup Instructions:
 Note: This script automatically detects and configures ImageMagick on Windows.
 """
 
+# Clip type annotations are not evaluated, so MoviePy can be imported lazily
+from __future__ import annotations
+
 # Standard library imports
 import os
 import re
 import math
 import argparse
+import io
+import functools
+import hashlib
+import itertools
+import contextlib
 import tempfile
+import shlex
 import subprocess
+import threading
+import platform
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
-# Monkey-patch for FFMPEG_AudioReader to ignore errors when closing the process.
-try:
-    from moviepy.audio.io import readers
-except ImportError:
-    readers = None
-
-if readers is not None and hasattr(readers, "FFMPEG_AudioReader"):
-    original_del = readers.FFMPEG_AudioReader.__del__
+# Video backend (MoviePy, gTTS, NumPy), imported on first use by load_video_backend
+# so the GUI window opens without waiting for the video stack to load
+VIDEO_BACKEND_LOCK = threading.Lock()
+VIDEO_BACKEND_LOADED = False
 
-    def safe_del(self):
+def load_video_backend():
+    """
+    Import the third-party video libraries into the module namespace.
+    Safe to call repeatedly and from several threads; only the first call imports,
+    later calls return immediately. The pipeline functions that use the libraries
+    (create_video_short, synthesize_narration, add_narration, export_video and
+    render_composition_ffmpeg) call it first, so they also work when imported as a library.
+    """
+    global VIDEO_BACKEND_LOADED
+    global VideoClip, VideoFileClip, ImageClip, TextClip, CompositeVideoClip, clips_array, concatenate_videoclips
+    global AudioClip, AudioFileClip, CompositeAudioClip, concatenate_audioclips
+    global ffmpeg_parse_infos, gTTS, np
+    
+    if VIDEO_BACKEND_LOADED:
+        return
+    with VIDEO_BACKEND_LOCK:
+        if VIDEO_BACKEND_LOADED:
+            return
+        
+        # Monkey-patch for FFMPEG_AudioReader to ignore errors when closing the process.
         try:
-            original_del(self)
-        except Exception:
-            pass  # Ignore any exceptions during process termination.
-
-    readers.FFMPEG_AudioReader.__del__ = safe_del
-
-# Third-party imports
-from moviepy.editor import *
-from moviepy.audio.AudioClip import AudioClip, concatenate_audioclips
-from gtts import gTTS
-import numpy as np
+            from moviepy.audio.io import readers
+        except ImportError:
+            readers = None
 
-# Note: PIL (Pillow) is used for animated GIF detection but is optional
-# If PIL is not available, GIFs will be treated as static images
+        if readers is not None and hasattr(readers, "FFMPEG_AudioReader"):
+            original_del = readers.FFMPEG_AudioReader.__del__
 
-# Configure ImageMagick for Windows
-import platform
-if platform.system() == "Windows":
-    try:
-        from moviepy.config import change_settings
-        import shutil
-        
-        # Try to find magick.exe in PATH
-        magick_path = shutil.which("magick")
-        if magick_path:
-            change_settings({"IMAGEMAGICK_BINARY": magick_path})
-            print(f"ImageMagick configured: {magick_path}")
-        else:
-            # Try common installation paths
-            common_paths = [
-                r"C:\Program Files\ImageMagick-7.*\magick.exe",
-                r"C:\Program Files (x86)\ImageMagick-7.*\magick.exe",
-                r"C:\ProgramData\chocolatey\bin\magick.exe",
-                r"C:\tools\ImageMagick\magick.exe"
-            ]
-            
-            import glob
-            for path_pattern in common_paths:
-                matches = glob.glob(path_pattern)
-                if matches:
-                    magick_path = matches[0]  # Use first match
+            def safe_del(self):
+                try:
+                    original_del(self)
+                except Exception:
+                    pass  # Ignore any exceptions during process termination.
+
+            readers.FFMPEG_AudioReader.__del__ = safe_del
+
+        # Third-party imports (moviepy.editor also attaches the fx methods such as
+        # fadein and resize to the clip classes)
+        from moviepy.editor import (VideoClip, VideoFileClip, ImageClip, TextClip, CompositeVideoClip,
+                                    clips_array, concatenate_videoclips, AudioFileClip, CompositeAudioClip)
+        from moviepy.audio.AudioClip import AudioClip, concatenate_audioclips
+        from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+        from gtts import gTTS
+        import numpy as np
+
+        # Note: PIL (Pillow) is used for animated GIF detection but is optional
+        # If PIL is not available, GIFs will be treated as static images
+
+        # Configure ImageMagick for Windows
+        if platform.system() == "Windows":
+            try:
+                from moviepy.config import change_settings
+                import shutil
+                
+                # Try to find magick.exe in PATH
+                magick_path = shutil.which("magick")
+                if magick_path:
                     change_settings({"IMAGEMAGICK_BINARY": magick_path})
                     print(f"ImageMagick configured: {magick_path}")
-                    break
-            else:
-                print("Warning: ImageMagick (magick.exe) not found. Text clips may not work properly.")
-                print("Please install ImageMagick from: https://imagemagick.org/script/download.php")
-    
-    except Exception as e:
-        print(f"Warning: Could not configure ImageMagick: {e}")
-        print("Some text features may not work properly.")
-        print("Please ensure ImageMagick is installed and 'magick.exe' is in your PATH.")
+                else:
+                    # Try common installation paths
+                    common_paths = [
+                        r"C:\Program Files\ImageMagick-7.*\magick.exe",
+                        r"C:\Program Files (x86)\ImageMagick-7.*\magick.exe",
+                        r"C:\ProgramData\chocolatey\bin\magick.exe",
+                        r"C:\tools\ImageMagick\magick.exe"
+                    ]
+                    
+                    import glob
+                    for path_pattern in common_paths:
+                        matches = glob.glob(path_pattern)
+                        if matches:
+                            magick_path = matches[0]  # Use first match
+                            change_settings({"IMAGEMAGICK_BINARY": magick_path})
+                            print(f"ImageMagick configured: {magick_path}")
+                            break
+                    else:
+                        print("Warning: ImageMagick (magick.exe) not found. Text clips may not work properly.")
+                        print("Please install ImageMagick from: https://imagemagick.org/script/download.php")
+            
+            except Exception as e:
+                print(f"Warning: Could not configure ImageMagick: {e}")
+                print("Some text features may not work properly.")
+                print("Please ensure ImageMagick is installed and 'magick.exe' is in your PATH.")
+        
+        VIDEO_BACKEND_LOADED = True
 
 # GUI imports
 try:
@@ -97,6 +137,77 @@ try:
 except ImportError:
     GUI_AVAILABLE = False
 
+# Supported media file extensions
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.tif', '.webp'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'})
+MEDIA_EXTENSIONS = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
+# Suffix tuples for str.endswith checks
+IMAGE_EXTENSION_SUFFIXES = tuple(sorted(IMAGE_EXTENSIONS))
+MEDIA_EXTENSION_SUFFIXES = tuple(sorted(MEDIA_EXTENSIONS))
+
+# Text processing patterns for narration and subtitles
+SUBTITLE_STRIP_TABLE = str.maketrans('', '', '\\@$%^&*()[]{};:"/<>#')
+PHRASE_SPLIT_PATTERN = re.compile(r'(?<=[.!?]) +|(?<=\.,) +|(?<=,) +(?=\w{3,})')
+# Rough syllable detection for offline narration timing: vowel groups (Latin and
+# Cyrillic scripts) plus one syllable per CJK/Hangul character
+VOWEL_GROUP_PATTERN = re.compile(r'[aeiouyàáâãäåæèéêëìíîïòóôõöøùúûüýÿąęаеёиоуыэюяії]+', re.IGNORECASE)
+SYLLABIC_CHAR_PATTERN = re.compile(r'[\u3040-\u30ff\u4e00-\u9fff\uac00-\ud7af]')
+
+# Output encoding settings shared by the MoviePy and FFmpeg-only render paths
+OUTPUT_FPS = 30
+VIDEO_CODEC = "libx264"
+VIDEO_PRESET = "faster"  # Noticeably quicker than "fast" at the same CRF
+# 4:2:0 Main profile plays everywhere; x264 picks the matching level from the resolution
+VIDEO_QUALITY_PARAMS = ["-crf", "23", "-pix_fmt", "yuv420p", "-profile:v", "main"]
+VIDEO_FFMPEG_PARAMS = [
+    "-movflags", "+faststart",  # moov atom up front for streaming
+    "-flush_packets", "0",  # Let the muxer buffer writes instead of flushing every packet
+]
+# Hardware H.264 encoders selectable with --hwaccel: codec name, preset (None for
+# encoders without presets) and the options that replace the x264 CRF settings
+# (rate control differs per encoder)
+HARDWARE_ENCODERS = {
+    "nvenc": ("h264_nvenc", "p4", ["-tune", "hq", "-rc", "vbr", "-cq", "23", "-b:v", "0", "-pix_fmt", "yuv420p"]),
+    "qsv": ("h264_qsv", "veryfast", ["-global_quality", "23", "-pix_fmt", "nv12"]),
+    "videotoolbox": ("h264_videotoolbox", None, ["-b:v", "8M", "-pix_fmt", "yuv420p"]),
+    "amf": ("h264_amf", None, ["-quality", "speed", "-pix_fmt", "yuv420p"]),
+}
+
+# Subtitle styling
+SUBTITLE_FONT_SIZE = 60
+SUBTITLE_MAX_WIDTH = 1000
+SUBTITLE_STROKE_WIDTH = 2  # Pillow captions (ImageMagick uses a 1.5px border)
+SUBTITLE_BG_PADDING = 20
+SUBTITLE_BG_OPACITY = 0.6
+SUBTITLE_ASS_FILENAME = 'subtitles.ass'  # Written to the scratch directory for --burn-subtitles
+
+# Choices offered by the GUI comboboxes and the CLI
+TRANSITION_TYPES = ("none", "fade", "slide_left", "slide_right", "slide_up", "slide_down", "zoom_in", "zoom_out")
+LANGUAGE_CHOICES = ("en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh", "pl")
+TEXT_COLOR_CHOICES = ("white", "black", "red", "blue", "green", "yellow", "cyan", "magenta")
+BORDER_COLOR_CHOICES = ("black", "white", "red", "blue", "green", "yellow", "cyan", "magenta")
+RESOLUTION_CHOICES = ("1080x1920", "720x1280", "1920x1080", "1280x720", "640x480")
+# Direction of motion (dx, dy) of the slide transitions
+SLIDE_DIRECTIONS = {
+    "slide_left": (-1, 0),
+    "slide_right": (1, 0),
+    "slide_up": (0, -1),
+    "slide_down": (0, 1),
+}
+# FFmpeg xfade equivalents of the sequence transitions (zoom_out has none)
+XFADE_TRANSITIONS = {
+    "fade": "fade",
+    "slide_left": "slideleft",
+    "slide_right": "slideright",
+    "slide_up": "slideup",
+    "slide_down": "slidedown",
+    "zoom_in": "zoomin",
+}
+
+# Synthesized narration is cached here so re-rendering the same script skips gTTS
+TTS_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                             'short-maker', 'tts')
+
 def get_available_font():
     """
     Get the best available font for text rendering on the current platform.
@@ -137,6 +248,81 @@ def get_available_font():
     # If we can't detect, return the most likely working font for Linux
     return 'DejaVu-Sans-Bold'
 
+def get_caption_font(fontsize: int):
+    """
+    Load a bold TrueType font for in-process subtitle rendering with Pillow.
+    Pillow searches the platform font directories for bare font file names.
+    
+    Args:
+        fontsize: Font size in pixels
+        
+    Returns:
+        ImageFont.FreeTypeFont or None if Pillow or a suitable font is not available
+    """
+    try:
+        from PIL import ImageFont
+    except ImportError:
+        return None
+    
+    possible_font_files = [
+        'arialbd.ttf',                # Windows
+        'DejaVuSans-Bold.ttf',        # Most common on Linux
+        'LiberationSans-Bold.ttf',    # Alternative Linux font
+        'Ubuntu-B.ttf',               # Ubuntu systems
+        'NotoSans-Bold.ttf',          # Google Noto fonts
+        'Arial Bold.ttf',             # macOS
+        'Helvetica.ttc'               # macOS fallback
+    ]
+    for font_file in possible_font_files:
+        try:
+            return ImageFont.truetype(font_file, fontsize)
+        except OSError:
+            continue
+    return None
+
+def render_caption(text: str, font, color: str, stroke_color: str, stroke_width: int, max_width: int) -> VideoClip:
+    """
+    Render word-wrapped, centered caption text with Pillow (no ImageMagick subprocess).
+    
+    Args:
+        text: Caption text
+        font: Pillow font from get_caption_font
+        color: Text color (name or hex code)
+        stroke_color: Border color (name or hex code)
+        stroke_width: Border width in pixels
+        max_width: Caption width in pixels; text is wrapped to fit
+        
+    Returns:
+        VideoClip: Static image clip with the caption and its transparency mask
+        
+    Raises:
+        ValueError: If Pillow does not recognize one of the colors
+    """
+    from PIL import Image, ImageDraw
+    
+    # Greedy word wrap against the rendered line width
+    lines = []
+    for word in text.split():
+        candidate = f"{lines[-1]} {word}" if lines else word
+        if lines and font.getlength(candidate) + 2 * stroke_width <= max_width:
+            lines[-1] = candidate
+        else:
+            lines.append(word)
+    
+    ascent, descent = font.getmetrics()
+    line_height = ascent + descent + 2 * stroke_width
+    image = Image.new('RGBA', (max_width, max(1, line_height * len(lines))), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for index, line in enumerate(lines):
+        x = (max_width - font.getlength(line)) / 2
+        draw.text((x, index * line_height + stroke_width), line, font=font, fill=color,
+                  stroke_width=stroke_width, stroke_fill=stroke_color)
+    
+    rgba = np.array(image)
+    mask = ImageClip(rgba[..., 3] / 255.0, ismask=True)
+    return ImageClip(rgba[..., :3]).set_mask(mask)
+
+@functools.lru_cache(maxsize=4096)
 def is_image_file(filepath: str) -> bool:
     """
     Check if file is an image based on extension.
@@ -147,10 +333,7 @@ def is_image_file(filepath: str) -> bool:
     Returns:
         bool: True if file is an image, False otherwise
     """
-    if not filepath:
-        return False
-    image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.tif', '.webp'}
-    return os.path.splitext(filepath.lower())[1] in image_extensions
+    return bool(filepath) and filepath.lower().endswith(IMAGE_EXTENSION_SUFFIXES)
 
 def is_animated_gif(filepath: str) -> bool:
     """
@@ -188,41 +371,169 @@ def parse_media_input(media_input: str) -> list:
     Returns:
         list: List of file paths
     """
+    return list(scan_media_input(media_input))
+
+@functools.lru_cache(maxsize=64)
+def scan_media_input(media_input: str) -> tuple:
+    """
+    Cached implementation of parse_media_input, so the directory listing and
+    existence checks run once per input string. Failed lookups raise and are
+    therefore never cached; call scan_media_input.cache_clear() to rescan.
+    
+    Args:
+        media_input: Input string containing file path(s) or directory
+        
+    Returns:
+        tuple: File paths
+    """
     if not media_input:
-        return []
+        return ()
     
     # Check if it's a directory
     if os.path.isdir(media_input):
         # Get all image and video files from directory
-        supported_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.tif', '.webp', 
-                              '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
-        files = []
-        for file in sorted(os.listdir(media_input)):
-            if os.path.splitext(file.lower())[1] in supported_extensions:
-                files.append(os.path.join(media_input, file))
-        return files
+        # (scandir entries carry their file type, so no extra stat per file)
+        with os.scandir(media_input) as entries:
+            files = sorted(
+                (entry.name, entry.path) for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(MEDIA_EXTENSION_SUFFIXES)
+            )
+        return tuple(path for _, path in files)
     
     # Check if it contains semicolons (multiple files)
     if ';' in media_input:
         files = [f.strip() for f in media_input.split(';') if f.strip()]
-        # Validate all files exist
-        for file in files:
-            if not os.path.exists(file):
-                raise ValueError(f"File not found: {file}")
-        return files
+        # Validate all files exist (reporting every missing one at once)
+        missing_files = [file for file in files if not os.path.exists(file)]
+        if missing_files:
+            raise ValueError("File not found: " + ", ".join(missing_files))
+        return tuple(files)
     
     # Single file
     if not os.path.exists(media_input):
         raise ValueError(f"File not found: {media_input}")
-    return [media_input]
+    return (media_input,)
+
+def parse_resolution(resolution: str) -> tuple:
+    """
+    Parse a WIDTHxHEIGHT resolution string. Odd values are rounded down to even
+    numbers, which 4:2:0 H.264 output (VIDEO_QUALITY_PARAMS) requires.
+    
+    Args:
+        resolution: Resolution string (e.g., "1080x1920")
+        
+    Returns:
+        tuple: (width, height) in pixels
+    """
+    width, height = resolution.split('x')
+    return int(width) // 2 * 2, int(height) // 2 * 2
+
+def probe_stream(filepath: str, stream: str, entries: str) -> list:
+    """
+    Read stream properties with ffprobe.
+    
+    Args:
+        filepath: Media file
+        stream: Stream specifier, e.g. 'v:0' or 'a:0'
+        entries: Comma-separated stream entries, e.g. 'codec_name,width,height'
+        
+    Returns:
+        list: Values in the order ffprobe prints them (empty if the stream does not exist),
+              or None if the file could not be probed
+    """
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', stream,
+             '-show_entries', f'stream={entries}', '-of', 'csv=p=0', filepath],
+            capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    output = result.stdout.strip()
+    return output.splitlines()[0].split(',') if output else []
+
+@functools.lru_cache(maxsize=64)
+def get_decode_resolution(filepath: str, target_size: tuple) -> tuple:
+    """
+    Compute the VideoFileClip target_resolution that lets FFmpeg scale frames
+    at decode time so they cover the target box while keeping aspect ratio.
+    
+    Args:
+        filepath: Path to video file
+        target_size: Target (width, height) in pixels
+        
+    Returns:
+        tuple: (height, width) with one side set to None, or None if unknown
+    """
+    if not target_size:
+        return None
+    try:
+        source_width, source_height = ffmpeg_parse_infos(filepath)['video_size']
+    except Exception:
+        return None
+    
+    target_width, target_height = target_size
+    if source_width / source_height > target_width / target_height:
+        return (target_height, None)
+    return (None, target_width)
+
+def open_video_file(filepath: str, target_resolution: tuple = None, media_cache: dict = None) -> VideoClip:
+    """
+    Open a video file with its own FFmpeg reader, since two uses of one file at different
+    times in a frame would make a shared reader seek back and forth. (When both halves
+    show the same media, create_video_short shares the whole clip instead: both halves
+    always read the same t.) Readers are recorded in the run's media cache so they are
+    closed when the run ends.
+    
+    Args:
+        filepath: Path to video file
+        target_resolution: Decode-time (height, width) from get_decode_resolution
+        media_cache: Optional per-run cache from create_media_cache
+        
+    Returns:
+        VideoClip: Video clip
+    """
+    clip = VideoFileClip(filepath, target_resolution=target_resolution)
+    if media_cache is not None:
+        media_cache['readers'].append(clip)
+    return clip
+
+def load_image_clip(filepath: str, duration: float, target_size: tuple = None) -> VideoClip:
+    """
+    Load a static image as a clip. JPEGs are decoded at a reduced scale (Pillow draft
+    mode) when they are much larger than the box they will fill, which makes large
+    photo slideshows faster to load and keeps only small frames in memory.
+    
+    Args:
+        filepath: Path to the image file
+        duration: Clip duration in seconds
+        target_size: Optional (width, height) the image will be fitted to
+        
+    Returns:
+        VideoClip: Static image clip
+    """
+    if target_size and filepath.lower().endswith(('.jpg', '.jpeg')):
+        try:
+            from PIL import Image
+            with Image.open(filepath) as img:
+                # Request at least the size that still covers the target box after cropping
+                scale = max(target_size[0] / img.width, target_size[1] / img.height)
+                img.draft('RGB', (math.ceil(img.width * scale), math.ceil(img.height * scale)))
+                return ImageClip(np.array(img.convert('RGB')), duration=duration)
+        except (ImportError, OSError):
+            pass
+    return ImageClip(filepath, duration=duration)
 
-def load_media_clip(filepath: str, default_duration: float = 5.0) -> VideoClip:
+def load_media_clip(filepath: str, default_duration: float = 5.0, target_size: tuple = None, media_cache: dict = None) -> VideoClip:
     """
     Load either video, animated GIF, or static image file as VideoClip.
     
     Args:
         filepath: Path to video or image file
         default_duration: Duration for static image clips in seconds
+        target_size: Optional (width, height) the clip will be fitted to; videos are
+                     scaled by FFmpeg while decoding instead of frame by frame
+        media_cache: Optional per-run cache from create_media_cache
         
     Returns:
         VideoClip: Loaded clip (video, animated GIF, or image converted to video)
@@ -232,7 +543,7 @@ def load_media_clip(filepath: str, default_duration: float = 5.0) -> VideoClip:
         if is_animated_gif(filepath):
             # Load animated GIF as video clip
             try:
-                gif_clip = VideoFileClip(filepath)
+                gif_clip = open_video_file(filepath, get_decode_resolution(filepath, target_size), media_cache)
                 
                 # If the GIF is shorter than the default duration, loop it
                 if gif_clip.duration < default_duration:
@@ -253,17 +564,129 @@ def load_media_clip(filepath: str, default_duration: float = 5.0) -> VideoClip:
             except Exception as e:
                 print(f"Warning: Could not load animated GIF {filepath} as video, treating as static image: {e}")
                 # Fall back to static image handling
-                image_clip = ImageClip(filepath, duration=default_duration)
-                return image_clip
+                return load_image_clip(filepath, default_duration, target_size)
         else:
             # Load static image and convert to video clip
-            image_clip = ImageClip(filepath, duration=default_duration)
-            return image_clip
+            return load_image_clip(filepath, default_duration, target_size)
     else:
         # Load video file
-        return VideoFileClip(filepath)
+        return open_video_file(filepath, get_decode_resolution(filepath, target_size), media_cache)
 
-def load_media_sequence(file_paths: list, default_duration: float = 5.0, transition_type: str = "none", transition_duration: float = 0.5) -> VideoClip:
+def render_sequence_ffmpeg(file_paths: list, transition_type: str, transition_duration: float,
+                           target_size: tuple, work_dir: str) -> str:
+    """
+    Join a sequence of video files with transitions in one FFmpeg xfade/acrossfade filter
+    graph, instead of compositing every transition frame in MoviePy.
+    
+    Args:
+        file_paths: Video files in playback order
+        transition_type: Transition between clips (key of XFADE_TRANSITIONS)
+        transition_duration: Duration of each transition in seconds
+        target_size: (width, height) every clip is scaled and center-cropped to
+        work_dir: Disk-backed scratch directory for the rendered sequence (not /dev/shm,
+                  the intermediate is a full-resolution video)
+        
+    Returns:
+        str: Path of the rendered sequence, or None if it needs the MoviePy path
+             (images, a transition without xfade equivalent, or mixed audio)
+    """
+    xfade_name = XFADE_TRANSITIONS.get(transition_type)
+    if not xfade_name or len(file_paths) < 2 or any(is_image_file(f) for f in file_paths):
+        return None
+    try:
+        infos = [ffmpeg_parse_infos(filepath) for filepath in file_paths]
+    except Exception:
+        return None
+    durations = [info['duration'] for info in infos]
+    with_audio = [info.get('audio_found', False) for info in infos]
+    if any(with_audio) and not all(with_audio):
+        return None
+    
+    # Same overlap as apply_transitions
+    overlap = min(transition_duration, min(durations) / 3)
+    width, height = target_size
+    
+    cmd = ['ffmpeg', '-y']
+    filters = []
+    for index, filepath in enumerate(file_paths):
+        cmd += ['-i', filepath]
+        # xfade needs the same size, frame rate and time base on both inputs
+        filters.append(f"[{index}:v]scale={width}:{height}:force_original_aspect_ratio=increase,"
+                       f"crop={width}:{height},setsar=1,fps={OUTPUT_FPS},settb=AVTB[v{index}]")
+    
+    # Each clip starts where the previous one begins to overlap, as in apply_transitions
+    video_label, audio_label, offset = "[v0]", "[0:a]", 0.0
+    for index in range(1, len(file_paths)):
+        offset += durations[index - 1] - overlap
+        filters.append(f"{video_label}[v{index}]xfade=transition={xfade_name}:duration={overlap}:offset={offset}[x{index}]")
+        video_label = f"[x{index}]"
+        if with_audio[0]:
+            filters.append(f"{audio_label}[{index}:a]acrossfade=d={overlap}[a{index}]")
+            audio_label = f"[a{index}]"
+    
+    fd, output_path = tempfile.mkstemp(prefix='sequence_', suffix='.mkv', dir=work_dir)
+    os.close(fd)
+    cmd += ['-filter_complex', ";".join(filters), '-map', video_label]
+    cmd += ['-map', audio_label, '-c:a', 'pcm_s16le'] if with_audio[0] else ['-an']
+    # Near-lossless intermediate; only the final export is encoded for size
+    cmd += ['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '16', output_path]
+    try:
+        subprocess.run(cmd, check=True)
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"Warning: Could not render the sequence with FFmpeg, using MoviePy: {e}")
+        os.remove(output_path)  # Drop the partial output
+        return None
+    return output_path
+
+def concat_videos_ffmpeg(file_paths: list, work_dir: str) -> str:
+    """
+    Join video files back to back with FFmpeg's concat demuxer, copying the streams
+    without decoding or re-encoding them. Only possible when every file has the same
+    video (and audio) stream parameters; probing stops at the first mismatch.
+    
+    Args:
+        file_paths: Video files in playback order
+        work_dir: Disk-backed scratch directory for the list file and the joined video
+                  (the join is as large as all inputs together, so not /dev/shm)
+        
+    Returns:
+        str: Path of the joined video, or None if the inputs cannot be stream-copied
+    """
+    if len(file_paths) < 2 or any(is_image_file(f) for f in file_paths):
+        return None
+    
+    first_params = None
+    for filepath in file_paths:
+        video_params = probe_stream(filepath, 'v:0', 'codec_name,width,height,pix_fmt,r_frame_rate,time_base')
+        if not video_params or (first_params and video_params != first_params[0]):
+            return None
+        audio_params = probe_stream(filepath, 'a:0', 'codec_name,sample_rate,channels')
+        if audio_params is None or (first_params and audio_params != first_params[1]):
+            return None
+        first_params = first_params or (video_params, audio_params)
+    
+    fd, list_path = tempfile.mkstemp(prefix='concat_', suffix='.txt', dir=work_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for filepath in file_paths:
+            # Concat list syntax: single-quoted, with embedded quotes escaped
+            escaped_path = os.path.abspath(filepath).replace("'", "'\\''")
+            f.write(f"file '{escaped_path}'\n")
+    output_path = list_path[:-len('.txt')] + '.mkv'
+    
+    cmd = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', list_path, '-c', 'copy', output_path]
+    try:
+        subprocess.run(cmd, check=True)
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"Warning: Could not join the videos with FFmpeg, using MoviePy: {e}")
+        if os.path.exists(output_path):
+            os.remove(output_path)  # Drop the partial output
+        return None
+    finally:
+        os.remove(list_path)
+    return output_path
+
+def load_media_sequence(file_paths: list, default_duration: float = 5.0, transition_type: str = "none", transition_duration: float = 0.5, target_size: tuple = None,
+                        work_dir: str = None, media_cache: dict = None) -> VideoClip:
     """
     Load multiple media files and concatenate them into a single clip with transitions.
     
@@ -272,6 +695,11 @@ def load_media_sequence(file_paths: list, default_duration: float = 5.0, transit
         default_duration: Duration for image clips in seconds
         transition_type: Type of transition ("none", "fade", "slide_left", "slide_right", "slide_up", "slide_down", "zoom_in", "zoom_out")
         transition_duration: Duration of transition effect in seconds
+        target_size: Optional (width, height) every clip is fitted to while loading, so
+                     videos are scaled by FFmpeg and only sliced, images resized once
+        work_dir: Optional disk-backed scratch directory; video-only sequences are then
+                  joined by FFmpeg (see concat_videos_ffmpeg and render_sequence_ffmpeg)
+        media_cache: Optional per-run cache from create_media_cache
         
     Returns:
         VideoClip: Concatenated clip from all input files with transitions
@@ -279,13 +707,33 @@ def load_media_sequence(file_paths: list, default_duration: float = 5.0, transit
     if not file_paths:
         raise ValueError("No files provided")
     
-    if len(file_paths) == 1:
-        return load_media_clip(file_paths[0], default_duration)
+    if work_dir and target_size and transition_type != "none" and transition_duration > 0:
+        sequence_path = render_sequence_ffmpeg(file_paths, transition_type, transition_duration, target_size, work_dir)
+        if sequence_path:
+            return open_video_file(sequence_path, media_cache=media_cache)
+    elif work_dir and (transition_type == "none" or transition_duration <= 0):
+        # Matching videos without transitions: one reader over the stream-copied join
+        concat_path = concat_videos_ffmpeg(file_paths, work_dir)
+        if concat_path:
+            clip = open_video_file(concat_path, get_decode_resolution(concat_path, target_size), media_cache)
+            return process_clip(clip, *target_size) if target_size else clip
+    
+    def load_fitted_clip(filepath):
+        clip = load_media_clip(filepath, default_duration, target_size, media_cache)
+        if target_size:
+            clip = process_clip(clip, *target_size)
+        return clip
     
-    clips = []
-    for filepath in file_paths:
-        clip = load_media_clip(filepath, default_duration)
-        clips.append(clip)
+    if len(file_paths) >= 4:
+        # Opening clips waits on FFmpeg probes and image decoding, so load them in parallel
+        # (map keeps the original order; smaller inputs are not worth the thread startup)
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            clips = list(executor.map(load_fitted_clip, file_paths))
+    else:
+        clips = [load_fitted_clip(filepath) for filepath in file_paths]
+    
+    if len(clips) == 1:
+        return clips[0]
     
     if transition_type == "none" or transition_duration <= 0:
         # Simple concatenation without transitions
@@ -294,6 +742,58 @@ def load_media_sequence(file_paths: list, default_duration: float = 5.0, transit
     # Apply transitions between clips
     return apply_transitions(clips, transition_type, transition_duration)
 
+def get_media_sequence(file_paths: list, default_duration: float = 5.0, transition_type: str = "none", transition_duration: float = 0.5, target_size: tuple = None,
+                       work_dir: str = None, media_cache: dict = None) -> VideoClip:
+    """
+    Load a media sequence through the run's media cache, so reloading media for narration
+    timing reuses sequences whose clips do not depend on the image duration.
+    
+    Args:
+        file_paths: List of file paths to load
+        default_duration: Duration for image clips in seconds
+        transition_type: Type of transition between clips
+        transition_duration: Duration of transition effect in seconds
+        target_size: Optional (width, height) every clip is fitted to
+        work_dir: Optional disk-backed scratch directory for FFmpeg-joined sequences
+                  (the media cache's own directory is used when media_cache is given)
+        media_cache: Optional per-run cache from create_media_cache (no caching without it)
+        
+    Returns:
+        VideoClip: Concatenated clip from all input files with transitions
+    """
+    if media_cache is None:
+        return load_media_sequence(file_paths, default_duration, transition_type, transition_duration, target_size, work_dir)
+    
+    if not any(map(is_image_file, file_paths)):
+        # Video-only sequences ignore the image duration
+        default_duration = None
+    key = (tuple(file_paths), default_duration, transition_type, transition_duration, target_size)
+    sequences = media_cache['sequences']
+    if key not in sequences:
+        sequences[key] = load_media_sequence(file_paths, default_duration, transition_type, transition_duration, target_size,
+                                             media_cache['video_dir'], media_cache)
+    return sequences[key]
+
+@contextlib.contextmanager
+def create_media_cache():
+    """
+    Create the media cache for one run, passed along with work_dir from
+    create_video_short to add_narration. Its clips are closed and its video
+    intermediates removed when the run ends.
+    
+    Yields:
+        dict: Loaded sequences keyed by their load parameters ('sequences'), every
+              video reader opened by open_video_file ('readers') and a disk-backed
+              directory for FFmpeg-joined sequences ('video_dir')
+    """
+    with create_work_dir(in_memory=False) as video_dir:
+        media_cache = {'sequences': {}, 'readers': [], 'video_dir': video_dir}
+        try:
+            yield media_cache
+        finally:
+            for clip in itertools.chain(media_cache['sequences'].values(), media_cache['readers']):
+                clip.close()
+
 def apply_transitions(clips: list, transition_type: str, transition_duration: float) -> VideoClip:
     """
     Apply transitions between video clips.
@@ -371,6 +871,23 @@ def apply_transitions(clips: list, transition_type: str, transition_duration: fl
         
         return CompositeVideoClip(result_clips)
 
+def slide_position(transition_type: str, clip_size: tuple, offset: float) -> tuple:
+    """
+    Position of a clip moved along the direction of a slide transition.
+    
+    Args:
+        transition_type: Slide transition (key of SLIDE_DIRECTIONS)
+        clip_size: (width, height) of the clip
+        offset: Displacement in clip sizes along the direction of motion
+                (negative before the resting position, positive after it)
+        
+    Returns:
+        tuple: (x, y) position, 'center' on the axis that does not move
+    """
+    dx, dy = SLIDE_DIRECTIONS[transition_type]
+    width, height = clip_size
+    return (dx * width * offset if dx else 'center', dy * height * offset if dy else 'center')
+
 def apply_entrance_transition(clip: VideoClip, transition_type: str, duration: float) -> VideoClip:
     """
     Apply entrance transition effect to a clip.
@@ -386,21 +903,9 @@ def apply_entrance_transition(clip: VideoClip, transition_type: str, duration: f
     if transition_type == "fade":
         return clip.fadein(duration)
     
-    elif transition_type == "slide_left":
-        # Slide in from right
-        return clip.set_position(lambda t: (max(0, clip.w * (1 - t/duration)) if t < duration else 0, 'center'))
-    
-    elif transition_type == "slide_right":
-        # Slide in from left
-        return clip.set_position(lambda t: (min(0, -clip.w * (1 - t/duration)) if t < duration else 0, 'center'))
-    
-    elif transition_type == "slide_up":
-        # Slide in from bottom
-        return clip.set_position(lambda t: ('center', max(0, clip.h * (1 - t/duration)) if t < duration else 'center'))
-    
-    elif transition_type == "slide_down":
-        # Slide in from top
-        return clip.set_position(lambda t: ('center', min(0, -clip.h * (1 - t/duration)) if t < duration else 'center'))
+    elif transition_type in SLIDE_DIRECTIONS:
+        # Slide in from off-screen (e.g. slide_left enters from the right)
+        return clip.set_position(lambda t: slide_position(transition_type, clip.size, min(t / duration, 1) - 1))
     
     elif transition_type == "zoom_in":
         # Zoom in effect with proper scaling and positioning
@@ -437,6 +942,36 @@ def apply_entrance_transition(clip: VideoClip, transition_type: str, duration: f
     else:
         return clip
 
+def zoom_frame(frame: np.ndarray, scale: float) -> np.ndarray:
+    """
+    Scale a frame (or mask) about its center while keeping its size: zooming in crops
+    the edges, zooming out pads them with black (transparent for masks).
+    
+    Args:
+        frame: Video frame (uint8 RGB) or mask (float) array
+        scale: Zoom factor, 1.0 leaves the frame unchanged
+        
+    Returns:
+        np.ndarray: Zoomed frame with the original shape
+    """
+    height, width = frame.shape[:2]
+    scaled_width, scaled_height = max(1, round(width * scale)), max(1, round(height * scale))
+    if (scaled_width, scaled_height) == (width, height):
+        return frame
+    
+    from PIL import Image
+    # Pillow resizes masks in 32-bit float mode
+    source = frame if frame.dtype == np.uint8 else frame.astype(np.float32)
+    scaled = np.asarray(Image.fromarray(source).resize((scaled_width, scaled_height), Image.BILINEAR))
+    
+    if scale > 1:
+        x, y = (scaled_width - width) // 2, (scaled_height - height) // 2
+        return scaled[y:y + height, x:x + width]
+    canvas = np.zeros(frame.shape, dtype=scaled.dtype)
+    x, y = (width - scaled_width) // 2, (height - scaled_height) // 2
+    canvas[y:y + scaled_height, x:x + scaled_width] = scaled
+    return canvas
+
 def apply_single_clip_transitions(clip: VideoClip, start_transition: str, end_transition: str, transition_duration: float) -> VideoClip:
     """
     Apply start and end transitions to a single clip
@@ -466,22 +1001,19 @@ def apply_single_clip_transitions(clip: VideoClip, start_transition: str, end_tr
                 result_clip = result_clip.fadein(actual_transition_duration)
             
             elif start_transition == "zoom_in":
-                # Create zoom-in effect using resize with proper error handling
+                # Create zoom-in effect (start small, end normal)
                 def zoom_in_func(get_frame, t):
                     if t < actual_transition_duration:
                         # Scale from 50% to 100%
                         progress = t / actual_transition_duration
                         scale = 0.5 + 0.5 * progress
-                        # Create a temporary clip with scaling
-                        try:
-                            frame = get_frame(t)
-                            temp_clip = ImageClip(frame, duration=0.1).resize(scale)
-                            return temp_clip.get_frame(0)
-                        except:
-                            return get_frame(t)
+                        # Rescale in place, keeping the frame size
+                        return zoom_frame(get_frame(t), scale)
                     return get_frame(t)
                 
-                result_clip = result_clip.fl(zoom_in_func, apply_to=['mask'])
+                # Only the frames are zoomed: the mask of the composed video is not used when
+                # it is written, and the black padding matches the compositor background
+                result_clip = result_clip.fl(zoom_in_func)
             
             elif start_transition == "zoom_out":
                 # Create zoom-out effect (start big, end normal)
@@ -490,65 +1022,20 @@ def apply_single_clip_transitions(clip: VideoClip, start_transition: str, end_tr
                         # Scale from 150% to 100%
                         progress = t / actual_transition_duration
                         scale = 1.5 - 0.5 * progress
-                        try:
-                            frame = get_frame(t)
-                            temp_clip = ImageClip(frame, duration=0.1).resize(scale)
-                            return temp_clip.get_frame(0)
-                        except:
-                            return get_frame(t)
+                        return zoom_frame(get_frame(t), scale)
                     return get_frame(t)
                 
-                result_clip = result_clip.fl(zoom_out_func, apply_to=['mask'])
+                result_clip = result_clip.fl(zoom_out_func)
             
-            elif start_transition.startswith("slide_"):
-                # For slide transitions, use position-based effects with fade fallback
-                if start_transition == "slide_left":
-                    # Slide in from right side
-                    def slide_pos(t):
-                        if t < actual_transition_duration:
-                            progress = t / actual_transition_duration
-                            # Start off-screen to the right, slide to center
-                            x_offset = result_clip.w * (1 - progress)
-                            return (x_offset, 'center')
-                        return ('center', 'center')
-                    
-                    result_clip = result_clip.set_position(slide_pos)
-                
-                elif start_transition == "slide_right":
-                    # Slide in from left side
-                    def slide_pos(t):
-                        if t < actual_transition_duration:
-                            progress = t / actual_transition_duration
-                            # Start off-screen to the left, slide to center
-                            x_offset = -result_clip.w * (1 - progress)
-                            return (x_offset, 'center')
-                        return ('center', 'center')
-                    
-                    result_clip = result_clip.set_position(slide_pos)
-                
-                elif start_transition == "slide_up":
-                    # Slide in from bottom
-                    def slide_pos(t):
-                        if t < actual_transition_duration:
-                            progress = t / actual_transition_duration
-                            # Start off-screen at bottom, slide to center
-                            y_offset = result_clip.h * (1 - progress)
-                            return ('center', y_offset)
-                        return ('center', 'center')
-                    
-                    result_clip = result_clip.set_position(slide_pos)
+            elif start_transition in SLIDE_DIRECTIONS:
+                # Slide in from off-screen, moving in the transition's direction
+                clip_size = result_clip.size
+                def slide_pos(t):
+                    if t < actual_transition_duration:
+                        return slide_position(start_transition, clip_size, t / actual_transition_duration - 1)
+                    return ('center', 'center')
                 
-                elif start_transition == "slide_down":
-                    # Slide in from top
-                    def slide_pos(t):
-                        if t < actual_transition_duration:
-                            progress = t / actual_transition_duration
-                            # Start off-screen at top, slide to center
-                            y_offset = -result_clip.h * (1 - progress)
-                            return ('center', y_offset)
-                        return ('center', 'center')
-                    
-                    result_clip = result_clip.set_position(slide_pos)
+                result_clip = result_clip.set_position(slide_pos)
                 
                 # Add fade for smoother effect
                 result_clip = result_clip.fadein(actual_transition_duration * 0.5)
@@ -572,15 +1059,10 @@ def apply_single_clip_transitions(clip: VideoClip, start_transition: str, end_tr
                         # Scale from 100% to 30%
                         progress = (t - end_start_time) / actual_transition_duration
                         scale = 1.0 - 0.7 * progress
-                        try:
-                            frame = get_frame(t)
-                            temp_clip = ImageClip(frame, duration=0.1).resize(scale)
-                            return temp_clip.get_frame(0)
-                        except:
-                            return get_frame(t)
+                        return zoom_frame(get_frame(t), scale)
                     return get_frame(t)
                 
-                result_clip = result_clip.fl(zoom_in_end_func, apply_to=['mask'])
+                result_clip = result_clip.fl(zoom_in_end_func)
             
             elif end_transition == "zoom_out":
                 # Zoom out at the end (expand to 150%)
@@ -591,63 +1073,21 @@ def apply_single_clip_transitions(clip: VideoClip, start_transition: str, end_tr
                         # Scale from 100% to 150%
                         progress = (t - end_start_time) / actual_transition_duration
                         scale = 1.0 + 0.5 * progress
-                        try:
-                            frame = get_frame(t)
-                            temp_clip = ImageClip(frame, duration=0.1).resize(scale)
-                            return temp_clip.get_frame(0)
-                        except:
-                            return get_frame(t)
+                        return zoom_frame(get_frame(t), scale)
                     return get_frame(t)
                 
-                result_clip = result_clip.fl(zoom_out_end_func, apply_to=['mask'])
+                result_clip = result_clip.fl(zoom_out_end_func)
             
-            elif end_transition.startswith("slide_"):
-                # For slide-out transitions at the end
+            elif end_transition in SLIDE_DIRECTIONS:
+                # Slide out of the frame in the transition's direction
                 end_start_time = result_clip.duration - actual_transition_duration
+                clip_size = result_clip.size
+                def slide_out_pos(t):
+                    if t > end_start_time:
+                        return slide_position(end_transition, clip_size, (t - end_start_time) / actual_transition_duration)
+                    return ('center', 'center')
                 
-                if end_transition == "slide_left":
-                    # Slide out to the left
-                    def slide_out_pos(t):
-                        if t > end_start_time:
-                            progress = (t - end_start_time) / actual_transition_duration
-                            x_offset = -result_clip.w * progress
-                            return (x_offset, 'center')
-                        return ('center', 'center')
-                    
-                    result_clip = result_clip.set_position(slide_out_pos)
-                
-                elif end_transition == "slide_right":
-                    # Slide out to the right
-                    def slide_out_pos(t):
-                        if t > end_start_time:
-                            progress = (t - end_start_time) / actual_transition_duration
-                            x_offset = result_clip.w * progress
-                            return (x_offset, 'center')
-                        return ('center', 'center')
-                    
-                    result_clip = result_clip.set_position(slide_out_pos)
-                
-                elif end_transition == "slide_up":
-                    # Slide out to the top
-                    def slide_out_pos(t):
-                        if t > end_start_time:
-                            progress = (t - end_start_time) / actual_transition_duration
-                            y_offset = -result_clip.h * progress
-                            return ('center', y_offset)
-                        return ('center', 'center')
-                    
-                    result_clip = result_clip.set_position(slide_out_pos)
-                
-                elif end_transition == "slide_down":
-                    # Slide out to the bottom
-                    def slide_out_pos(t):
-                        if t > end_start_time:
-                            progress = (t - end_start_time) / actual_transition_duration
-                            y_offset = result_clip.h * progress
-                            return ('center', y_offset)
-                        return ('center', 'center')
-                    
-                    result_clip = result_clip.set_position(slide_out_pos)
+                result_clip = result_clip.set_position(slide_out_pos)
                 
                 # Add fade for smoother effect
                 result_clip = result_clip.fadeout(actual_transition_duration * 0.5)
@@ -658,13 +1098,16 @@ def apply_single_clip_transitions(clip: VideoClip, start_transition: str, end_tr
     
     return result_clip
 
-def adjust_media_duration_for_narration(args: argparse.Namespace, narration_duration: float = None) -> tuple:
+def adjust_media_duration_for_narration(args: argparse.Namespace, narration_duration: float = None, work_dir: str = None,
+                                        media_cache: dict = None) -> tuple:
     """
     Reload media clips with appropriate duration when narration is used.
     
     Args:
         args: Command-line arguments
         narration_duration: Duration of narration audio
+        work_dir: Optional scratch directory from create_work_dir
+        media_cache: Optional per-run cache from create_media_cache
         
     Returns:
         tuple: (top_clip, bottom_clip) with adjusted durations
@@ -686,23 +1129,33 @@ def adjust_media_duration_for_narration(args: argparse.Namespace, narration_dura
     start_transition = getattr(args, 'start_transition', 'none')
     end_transition = getattr(args, 'end_transition', 'none')
     
+    # Target size each clip will be fitted to (half height for split-screen)
+    target_width, target_height = parse_resolution(args.resolution)
+    if bottom_files:
+        target_height //= 2
+    target_size = (target_width, target_height)
+    
     # For sequences with narration, we need to handle duration differently
     if narration_duration and len(top_files) > 1:
         # For multiple files with narration, distribute narration time across all files
         duration_per_file = narration_duration / len(top_files)
-        top_clip = load_media_sequence(top_files, duration_per_file, transition_type, transition_duration)
+        top_clip = get_media_sequence(top_files, duration_per_file, transition_type, transition_duration, target_size, work_dir, media_cache)
     else:
         # Single file or no narration - use normal duration
-        top_clip = load_media_sequence(top_files, duration, transition_type, transition_duration)
+        top_clip = get_media_sequence(top_files, duration, transition_type, transition_duration, target_size, work_dir, media_cache)
         
         # Note: Start/end transitions will be applied to final video in create_video_short
     
-    if bottom_files:
+    if bottom_files == top_files:
+        # Same media on both halves - share one FFmpeg reader instead of decoding twice
+        # (safe only because both halves are always read at the same t)
+        bottom_clip = top_clip
+    elif bottom_files:
         if narration_duration and len(bottom_files) > 1:
             duration_per_file = narration_duration / len(bottom_files)
-            bottom_clip = load_media_sequence(bottom_files, duration_per_file, transition_type, transition_duration)
+            bottom_clip = get_media_sequence(bottom_files, duration_per_file, transition_type, transition_duration, target_size, work_dir, media_cache)
         else:
-            bottom_clip = load_media_sequence(bottom_files, duration, transition_type, transition_duration)
+            bottom_clip = get_media_sequence(bottom_files, duration, transition_type, transition_duration, target_size, work_dir, media_cache)
             
         # Note: Start/end transitions will be applied to final video in create_video_short
     else:
@@ -725,31 +1178,24 @@ def process_clip(clip: VideoClip, target_width: int, target_height: int) -> Vide
     original_aspect = clip.w / clip.h
     target_aspect = target_width / target_height
 
-    # Scale while maintaining aspect ratio
-    if original_aspect > target_aspect:
+    # Scale while maintaining aspect ratio (skipped when FFmpeg already scaled at decode time)
+    if ((clip.w == target_width and clip.h >= target_height) or
+            (clip.h == target_height and clip.w >= target_width)):
+        resized = clip
+    elif original_aspect > target_aspect:
         resized = clip.resize(height=target_height)
     else:
         resized = clip.resize(width=target_width)
 
-    # Center cropping to target dimensions
-    if resized.w > target_width:
-        cropped = resized.crop(
-            x_center=resized.w/2,
-            y_center=resized.h/2,
-            width=target_width,
-            height=target_height
-        )
-    elif resized.h > target_height:
-        cropped = resized.crop(
-            x_center=resized.w/2,
-            y_center=resized.h/2,
-            width=target_width,
-            height=target_height
-        )
-    else:
-        cropped = resized
-    
-    return cropped
+    # Center cropping to target dimensions (exact fits skip the per-frame crop)
+    if resized.w == target_width and resized.h == target_height:
+        return resized
+    return resized.crop(
+        x_center=resized.w/2,
+        y_center=resized.h/2,
+        width=target_width,
+        height=target_height
+    )
 
 def loop_audio(audio_clip: AudioClip, duration: float) -> AudioClip:
     """
@@ -762,23 +1208,89 @@ def loop_audio(audio_clip: AudioClip, duration: float) -> AudioClip:
     Returns:
         AudioClip: Looped audio matching target duration
     """
-    loops = []
-    current_duration = 0
-    while current_duration < duration:
-        loops.append(audio_clip)
-        current_duration += audio_clip.duration
-    return concatenate_audioclips(loops).subclip(0, duration)
+    clip_duration = audio_clip.duration
 
-def create_video_short(args: argparse.Namespace) -> VideoClip:
+    def looped_frame(get_frame, t):
+        if np.isscalar(t):
+            return get_frame(t % clip_duration)
+        looped_t = np.asarray(t) % clip_duration
+        # Read each monotonic segment separately so the reader never seeks mid-chunk
+        wraps = np.flatnonzero(np.diff(looped_t) < 0) + 1
+        if not len(wraps):
+            return get_frame(looped_t)
+        return np.vstack([get_frame(segment) for segment in np.split(looped_t, wraps)])
+
+    return audio_clip.fl(looped_frame).set_duration(duration)
+
+def load_looped_music(music_path: str, duration: float, work_dir: str = None) -> AudioClip:
+    """
+    Load background music looped to the specified duration.
+    FFmpeg pre-renders the loop with -stream_loop into the scratch directory, so the
+    music is decoded as one continuous stream instead of seeking back at every wrap.
+    
+    Args:
+        music_path: Background music file
+        duration: Target duration in seconds
+        work_dir: Scratch directory from create_work_dir (None to loop in MoviePy)
+        
+    Returns:
+        AudioClip: Looped music matching target duration
+    """
+    if work_dir is not None:
+        looped_filename = os.path.join(work_dir, 'music_looped.wav')
+        ffmpeg_cmd = [
+            'ffmpeg',
+            '-y',  # Overwrite output file without prompting
+            '-stream_loop', '-1',  # Repeat the input indefinitely, cut by -t
+            '-i', music_path,
+            '-t', str(duration),
+            '-vn',  # Ignore embedded cover art
+            '-c:a', 'pcm_s16le',
+            looped_filename
+        ]
+        try:
+            subprocess.run(ffmpeg_cmd, check=True)
+            return AudioFileClip(looped_filename).set_duration(duration)
+        except Exception as e:
+            print(f"Error looping music with FFmpeg: {e}")
+    
+    return loop_audio(AudioFileClip(music_path), duration)
+
+def loop_video(clip: VideoClip, duration: float) -> VideoClip:
+    """
+    Loop video to match specified duration.
+    
+    Args:
+        clip: Input video clip
+        duration: Target duration in seconds
+        
+    Returns:
+        VideoClip: Looped video (and audio) matching target duration
+    """
+    if isinstance(clip, ImageClip):
+        # A static image has the same frame at every time, so just extend it
+        return clip.set_duration(duration)
+    
+    clip_duration = clip.duration
+    looped = clip.fl_time(lambda t: t % clip_duration, apply_to=['mask'])
+    if clip.audio is not None:
+        looped = looped.set_audio(loop_audio(clip.audio, duration))
+    return looped.set_duration(duration)
+
+def create_video_short(args: argparse.Namespace, work_dir: str = None, media_cache: dict = None) -> VideoClip:
     """
     Create vertical video composition from input videos and/or images.
     
     Args:
         args: Command-line arguments containing input parameters
+        work_dir: Optional scratch directory from create_work_dir for intermediate audio
+        media_cache: Optional per-run cache from create_media_cache, reused by add_narration
         
     Returns:
         VideoClip: Processed video clip with combined elements
     """
+    load_video_backend()
+    
     # Determine default duration for images based on narration or fallback
     default_image_duration = getattr(args, 'image_duration', 5.0)
     
@@ -792,20 +1304,24 @@ def create_video_short(args: argparse.Namespace) -> VideoClip:
     start_transition = getattr(args, 'start_transition', 'none')
     end_transition = getattr(args, 'end_transition', 'none')
     
-    # Load media clips (video or image sequences)
-    top_clip = load_media_sequence(top_files, default_image_duration, transition_type, transition_duration)
-    bottom_clip = load_media_sequence(bottom_files, default_image_duration, transition_type, transition_duration) if bottom_files else None
+    # Parse resolution
+    target_width, target_height = parse_resolution(args.resolution)
+    half_height = target_height // 2
+    
+    # Load media clips (video or image sequences), letting FFmpeg scale videos while decoding
+    clip_size = (target_width, half_height) if bottom_files else (target_width, target_height)
+    top_clip = get_media_sequence(top_files, default_image_duration, transition_type, transition_duration, clip_size, work_dir, media_cache)
+    if bottom_files == top_files:
+        # Same media on both halves - share one FFmpeg reader instead of decoding twice
+        # (safe only because both halves are always read at the same t)
+        bottom_clip = top_clip
+    else:
+        bottom_clip = get_media_sequence(bottom_files, default_image_duration, transition_type, transition_duration, clip_size, work_dir, media_cache) if bottom_files else None
     
     # Note: Start/end transitions will be applied to the final composed video later
 
-    # Parse resolution
-    target_width, target_height = map(int, args.resolution.split('x'))
-
     if args.bottom_video:
-        # Two-media vertical composition
-        half_height = target_height // 2
-
-        # Process both clips
+        # Two-media vertical composition - process both clips
         processed_top = process_clip(top_clip, target_width, half_height)
         processed_bottom = process_clip(bottom_clip, target_width, half_height)
 
@@ -818,13 +1334,11 @@ def create_video_short(args: argparse.Namespace) -> VideoClip:
         final_duration = max(top_duration, bottom_duration)
         
         # Adjust clips to match final duration
-        if processed_top.duration < final_duration:
-            loops_needed = math.ceil(final_duration / processed_top.duration)
-            processed_top = concatenate_videoclips([processed_top]*loops_needed).subclip(0, final_duration)
+        if top_duration < final_duration:
+            processed_top = loop_video(processed_top, final_duration)
             
-        if processed_bottom.duration < final_duration:
-            loops_needed = math.ceil(final_duration / processed_bottom.duration)
-            processed_bottom = concatenate_videoclips([processed_bottom]*loops_needed).subclip(0, final_duration)
+        if bottom_duration < final_duration:
+            processed_bottom = loop_video(processed_bottom, final_duration)
 
         # Combine vertically
         final_video = clips_array([[processed_top], [processed_bottom]])
@@ -839,7 +1353,6 @@ def create_video_short(args: argparse.Namespace) -> VideoClip:
     audio_tracks = []
 
     # Original video audio (only if top clip has audio and contains videos, not just images)
-    top_files = parse_media_input(args.top_video)
     has_video_files = any(not is_image_file(f) for f in top_files)
     if args.audio and processed_top.audio and has_video_files:
         top_audio = loop_audio(processed_top.audio, total_duration)
@@ -847,8 +1360,7 @@ def create_video_short(args: argparse.Namespace) -> VideoClip:
 
     # Background music
     if args.music and not args.text:
-        music = AudioFileClip(args.music)
-        music_looped = loop_audio(music, total_duration)
+        music_looped = load_looped_music(args.music, total_duration, work_dir)
         music_looped = music_looped.volumex(args.music_volume / 100.0)
         audio_tracks.append(music_looped)
 
@@ -870,140 +1382,417 @@ def split_phrases(text: str, max_chars: int = 50) -> list:
     Split text into subtitle phrases using smart punctuation detection.
     
     Args:
-        text: Input text to split
+        text: Input text to split (already stripped with SUBTITLE_STRIP_TABLE)
         max_chars: Maximum characters per subtitle phrase
         
     Returns:
         list: List of phrase chunks for subtitles
     """
-    pattern = r'(?<=[.!?]) +|(?<=\.,) +|(?<=,) +(?=\w{3,})'
-    phrases = re.split(pattern, text)
+    phrases = PHRASE_SPLIT_PATTERN.split(text)
     chunks = []
-    current_chunk = ""
+    current_tokens = []
+    current_length = 0
     
     for phrase in phrases:
-        clean_phrase = re.sub(r'[\\@$%^&*()\[\]{};:"/<>#]', '', phrase.strip())
+        clean_phrase = phrase.strip()
         if not clean_phrase:
             continue
             
-        if len(current_chunk) + len(clean_phrase) + 1 <= max_chars:
-            current_chunk += " " + clean_phrase if current_chunk else clean_phrase
+        if current_length + len(clean_phrase) + 1 <= max_chars:
+            current_tokens.append(clean_phrase)
+            current_length += len(clean_phrase) + (1 if current_length else 0)
         else:
-            if current_chunk:
-                chunks.append(current_chunk)
-            current_chunk = clean_phrase
+            if current_tokens:
+                chunks.append(" ".join(current_tokens))
+            current_tokens = [clean_phrase]
+            current_length = len(clean_phrase)
+    
+    if current_tokens:
+        chunks.append(" ".join(current_tokens))
+    
+    return chunks
+
+def bake_subtitle_clip(txt_clip: VideoClip, bg_box: bool, padding: int = SUBTITLE_BG_PADDING, bg_opacity: float = SUBTITLE_BG_OPACITY) -> VideoClip:
+    """
+    Pre-render a subtitle text clip and its background box into one RGBA image clip.
+    
+    Args:
+        txt_clip: Rendered TextClip for the phrase
+        bg_box: Whether to blend a semi-transparent black box behind the text
+        padding: Box padding around the text in pixels
+        bg_opacity: Opacity of the background box
+        
+    Returns:
+        VideoClip: Static clip with text and box baked into a single frame and mask
+    """
+    if not bg_box:
+        return txt_clip
+    
+    frame = txt_clip.get_frame(0).astype(np.float32)
+    if txt_clip.mask is not None:
+        alpha = txt_clip.mask.get_frame(0).astype(np.float32)
+    else:
+        alpha = np.ones(frame.shape[:2], dtype=np.float32)
+    
+    height, width = alpha.shape
+    box_alpha = np.full((height + 2 * padding, width + 2 * padding), bg_opacity, dtype=np.float32)
+    box_rgb = np.zeros(box_alpha.shape + (3,), dtype=np.float32)
+    
+    # Composite text "over" the black box so the result matches the two layered clips
+    text_area = (slice(padding, padding + height), slice(padding, padding + width))
+    box_alpha[text_area] = alpha + bg_opacity * (1 - alpha)
+    box_rgb[text_area] = frame * (alpha / box_alpha[text_area])[..., None]
+    
+    mask = ImageClip(box_alpha, ismask=True).set_duration(txt_clip.duration)
+    return ImageClip(box_rgb.round().astype(np.uint8)).set_mask(mask).set_duration(txt_clip.duration)
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_has_filter(name: str) -> bool:
+    """
+    Check whether the installed FFmpeg provides a filter (e.g. 'subtitles', which needs libass).
+    
+    Args:
+        name: Filter name
+        
+    Returns:
+        bool: True if the filter is listed by ffmpeg -filters
+    """
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-filters'], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return any(line.split()[1:2] == [name] for line in result.stdout.splitlines())
+
+def ffmpeg_filter_has_option(name: str, option: str) -> bool:
+    """
+    Check whether a filter of the installed FFmpeg accepts an option (e.g. amix normalize, FFmpeg 4.4+).
     
-    if current_chunk:
-        chunks.append(current_chunk)
+    Args:
+        name: Filter name
+        option: Option name
+        
+    Returns:
+        bool: True if the option is listed by ffmpeg -h filter=name
+    """
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-h', f'filter={name}'], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return any(line.split()[:1] == [option] for line in result.stdout.splitlines())
+
+def escape_filter_value(value: str) -> str:
+    """
+    Escape a filter option value (e.g. a file path) for use in an FFmpeg filter graph:
+    first for the option level, then for the filter graph description level.
+    
+    Args:
+        value: Raw option value
+        
+    Returns:
+        str: Value that can be used unquoted after "option="
+    """
+    value = re.sub(r"([\\:'])", r"\\\1", value)
+    return re.sub(r"([\\'\[\],;])", r"\\\1", value)
+
+def format_ass_color(color: str, opacity: float = 1.0) -> str:
+    """
+    Convert a color name or hex code to the ASS &HAABBGGRR notation.
+    
+    Args:
+        color: Color name or hex code
+        opacity: Opacity from 0 (transparent) to 1 (opaque)
+        
+    Returns:
+        str: ASS color string
+        
+    Raises:
+        ValueError: If the color is not recognized
+    """
+    from PIL import ImageColor
+    red, green, blue = ImageColor.getrgb(color)[:3]
+    alpha = round((1 - opacity) * 255)
+    return f"&H{alpha:02X}{blue:02X}{green:02X}{red:02X}"
+
+def format_ass_time(seconds: float) -> str:
+    """
+    Format a timestamp as H:MM:SS.cc for ASS dialogue lines.
+    
+    Args:
+        seconds: Time in seconds
+        
+    Returns:
+        str: ASS timestamp
+    """
+    centiseconds = int(round(seconds * 100))
+    hours, centiseconds = divmod(centiseconds, 360000)
+    minutes, centiseconds = divmod(centiseconds, 6000)
+    secs, centiseconds = divmod(centiseconds, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centiseconds:02d}"
+
+def write_ass_subtitles(phrases: list, phrase_durations: list, args: argparse.Namespace,
+                        video_size: tuple, output_path: str) -> bool:
+    """
+    Write the subtitles as an ASS script so FFmpeg can burn them in with libass during
+    export, instead of MoviePy compositing a caption layer on every frame.
+    
+    Args:
+        phrases: Subtitle phrases
+        phrase_durations: Duration of each phrase in seconds
+        args: Command-line arguments (text colors, background box, animation)
+        video_size: (width, height) of the final video
+        output_path: Path of the .ass file to write
+        
+    Returns:
+        bool: False if FFmpeg lacks the subtitles filter or a color is not supported,
+              in which case the MoviePy captions should be used
+    """
+    if not ffmpeg_has_filter('subtitles'):
+        print("Warning: FFmpeg has no subtitles filter (libass); compositing subtitles with MoviePy")
+        return False
+    try:
+        text_color = format_ass_color(args.text_color)
+        border_color = format_ass_color(args.text_border_color or 'black')
+        box_color = format_ass_color('black', SUBTITLE_BG_OPACITY)
+    except (ImportError, ValueError) as e:
+        print(f"Warning: Cannot burn subtitles with FFmpeg ({e}); compositing subtitles with MoviePy")
+        return False
+    
+    width, height = video_size
+    side_margin = max(0, (width - SUBTITLE_MAX_WIDTH) // 2)
+    if args.bg_box:
+        # Border style 3 draws an opaque box in the outline color, padded by the outline width
+        border_style, outline_color, outline = 3, box_color, SUBTITLE_BG_PADDING
+    else:
+        border_style, outline_color, outline = 1, border_color, SUBTITLE_STROKE_WIDTH
+    font_name = get_available_font().replace('-', ' ')
+    
+    lines = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {width}",
+        f"PlayResY: {height}",
+        "WrapStyle: 0",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+        "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+        "Alignment, MarginL, MarginR, MarginV, Encoding",
+        f"Style: Default,{font_name},{SUBTITLE_FONT_SIZE},{text_color},{text_color},{outline_color},{box_color},"
+        f"-1,0,0,0,100,100,0,0,{border_style},{outline},0,5,{side_margin},{side_margin},0,1",
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+    # Same fade timing as the MoviePy captions (fade out is half the fade in)
+    fade = f"{{\\fad({int(args.fade_duration * 1000)},{int(args.fade_duration * 500)})}}" if args.animate_text else ""
+    current_time = 0
+    for phrase, duration in zip(phrases, phrase_durations):
+        lines.append(f"Dialogue: 0,{format_ass_time(current_time)},{format_ass_time(current_time + duration)},"
+                     f"Default,,0,0,0,,{fade}{phrase}")
+        current_time += duration
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    return True
+
+def estimate_syllables(text: str) -> float:
+    """
+    Estimate the number of spoken syllables in a phrase without any TTS engine.
+    
+    Args:
+        text: Phrase text
+        
+    Returns:
+        float: Approximate syllable count
+    """
+    syllables = len(VOWEL_GROUP_PATTERN.findall(text)) + len(SYLLABIC_CHAR_PATTERN.findall(text))
+    # Scripts without detectable vowels: assume roughly three characters per syllable
+    return syllables if syllables else len(text) / 3
+
+def calculate_phrase_durations(text_chunks: list, total_duration: float) -> list:
+    """
+    Estimate duration for each text chunk from the length of the full narration.
+    
+    The narration is synthesized once for the whole text, so phrase timings are
+    estimated offline (about 0.22s per syllable plus a short pause per phrase, longer
+    after a sentence end) and then scaled to match the real narration length.
+    
+    Args:
+        text_chunks: List of text phrases
+        total_duration: Duration of the narration audio in seconds
+        
+    Returns:
+        list: Durations for each phrase in seconds
+    """
+    if not text_chunks:
+        return []
+    weights = np.array([
+        estimate_syllables(chunk) * 0.22 + (0.4 if chunk.endswith(('.', '!', '?')) else 0.15)
+        for chunk in text_chunks
+    ], dtype=np.float64)
+    if weights.sum() <= 0:
+        return [total_duration / len(text_chunks)] * len(text_chunks)
+    return (weights / weights.sum() * total_duration).tolist()
+
+def create_work_dir(in_memory: bool = True) -> tempfile.TemporaryDirectory:
+    """
+    Create a self-cleaning scratch directory for intermediate narration audio and subtitles.
+    Uses RAM-backed /dev/shm when it is available (often only 64 MB in containers).
+    
+    Args:
+        in_memory: False for video-sized intermediates, which go to the regular temp directory
+        
+    Returns:
+        tempfile.TemporaryDirectory: Context manager yielding the directory path
+    """
+    shm_dir = '/dev/shm'
+    base_dir = shm_dir if in_memory and os.path.isdir(shm_dir) and os.access(shm_dir, os.W_OK) else None
+    # Audio readers may still hold files open on Windows, so never fail on cleanup
+    return tempfile.TemporaryDirectory(prefix='short-maker-', dir=base_dir, ignore_cleanup_errors=True)
+
+def fetch_tts_audio(text: str, lang: str) -> bytes:
+    """
+    Synthesize text with gTTS, reusing a cached MP3 from an earlier run when available.
+    The speed change is applied afterwards, so one cached file serves every speed.
+    
+    Args:
+        text: Text to synthesize
+        lang: Language code for TTS
+        
+    Returns:
+        bytes: MP3 audio data
+    """
+    key = hashlib.blake2b(f"{lang}|{text}".encode('utf-8'), digest_size=16).hexdigest()
+    cache_path = os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+    try:
+        with open(cache_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        pass
+    
+    # Generate TTS audio in memory
+    tts_buffer = io.BytesIO()
+    gTTS(text=text, lang=lang, slow=False).write_to_fp(tts_buffer)
+    tts_bytes = tts_buffer.getvalue()
+    
+    # Store through a temporary name so concurrent runs never read a partial file
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(tts_bytes)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not cache narration audio: {e}")
+    return tts_bytes
+
+def synthesize_narration(text_path: str, lang: str, work_dir: str, speed: float = 1.0) -> tuple:
+    """
+    Load narration text, split it into subtitle phrases and synthesize it with gTTS
+    (see fetch_tts_audio for the on-disk cache).
+    The MP3 from gTTS is piped straight into FFmpeg, which applies the speed change
+    and writes a single WAV file that MoviePy can seek cheaply.
+    
+    Args:
+        text_path: Path to the narration text file
+        lang: Language code for TTS
+        work_dir: Scratch directory from create_work_dir
+        speed: Narration speed multiplier applied with FFmpeg's atempo filter
+        
+    Returns:
+        tuple: (List of phrases, TTS audio file path)
+    """
+    load_video_backend()
     
-    return chunks
+    # Load and clean text
+    with open(text_path, 'r', encoding='utf-8') as f:
+        text_content = f.read().replace('\n', ' ')
+    cleaned_text = text_content.translate(SUBTITLE_STRIP_TABLE)
+    phrases = split_phrases(cleaned_text)
+
+    if not phrases:
+        raise ValueError("No text available for narration!")
 
-def calculate_phrase_durations(text_chunks: list, lang: str) -> list:
+    tts_bytes = fetch_tts_audio(" ".join(phrases), lang)
+
+    # Decode (and speed-adjust without pitch alteration) in one FFmpeg pass
+    tts_filename = os.path.join(work_dir, 'narration.wav')
+    ffmpeg_cmd = ['ffmpeg', '-y', '-f', 'mp3', '-i', 'pipe:0']
+    if speed != 1.0:
+        ffmpeg_cmd += ['-filter:a', f'atempo={speed}']
+    ffmpeg_cmd += ['-c:a', 'pcm_s16le', tts_filename]
+
+    try:
+        subprocess.run(ffmpeg_cmd, input=tts_bytes, check=True)
+    except Exception as e:
+        print(f"Error processing narration audio: {e}")
+        # Fall back to the unmodified gTTS output
+        tts_filename = os.path.join(work_dir, 'narration.mp3')
+        with open(tts_filename, 'wb') as f:
+            f.write(tts_bytes)
+
+    return phrases, tts_filename
+
+def prefetch_narration(args: argparse.Namespace, work_dir: str) -> Future:
     """
-    Calculate duration for each text chunk using Text-to-Speech.
+    Start narration synthesis on a background thread so the gTTS request
+    overlaps with video composition.
     
     Args:
-        text_chunks: List of text phrases
-        lang: Language code for TTS
+        args: Command-line arguments
+        work_dir: Scratch directory from create_work_dir
         
     Returns:
-        list: Durations for each phrase in seconds
+        Future: Resolves to the (phrases, TTS audio file path) tuple of synthesize_narration
     """
-    durations = []
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        for i, chunk in enumerate(text_chunks):
-            try:
-                tts = gTTS(text=chunk, lang=lang, slow=False)
-                tmp_file = os.path.join(tmp_dir, f"temp_{i}.mp3")
-                tts.save(tmp_file)
-                audio = AudioFileClip(tmp_file)
-                durations.append(audio.duration)
-                audio.close()
-            except Exception as e:
-                print(f"Error processing phrase '{chunk}': {str(e)}")
-                durations.append(0)
-    return durations
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(synthesize_narration, args.text, args.lang, work_dir, args.speed)
+    executor.shutdown(wait=False)  # Worker exits once synthesis finishes
+    return future
 
-def add_narration(video_clip: VideoClip, args: argparse.Namespace) -> tuple:
+def add_narration(video_clip: VideoClip, args: argparse.Namespace, work_dir: str, narration_future: Future = None,
+                  media_cache: dict = None) -> tuple:
     """
     Add narrated audio and subtitles to video clip with speed adjustment.
     
     Args:
         video_clip: Input video clip
         args: Command-line arguments
+        work_dir: Scratch directory from create_work_dir for intermediate audio
+        narration_future: Optional pending result of prefetch_narration
+        media_cache: Optional per-run cache from create_media_cache
         
     Returns:
-        tuple: (Final video clip, List of TTS temp file paths)
+        tuple: (final video clip, ASS subtitle file for export_video to burn in, or None)
     """
-    # Load and clean text
-    with open(args.text, 'r', encoding='utf-8') as f:
-        text_content = f.read().replace('\n', ' ')
-    cleaned_text = re.sub(r'[\\@$%^&*()\[\]{};:"/<>#]', '', text_content)
-    phrases = split_phrases(cleaned_text)
-
-    if not phrases and args.subtitles:
-        raise ValueError("No text available for subtitles!")
-
-    # Generate TTS audio with temporary file
-    with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tts_temp:
-        tts_temp_filename = tts_temp.name
-
-    tts = gTTS(text=" ".join(phrases), lang=args.lang, slow=False)
-    tts.save(tts_temp_filename)
-    tts_temp_files = [tts_temp_filename]  # Track all temporary audio files
-
-    # Process speed adjustment with FFmpeg's atempo filter
-    if args.speed != 1.0:
-        # Create temporary file for speed-adjusted audio
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as speed_temp:
-            speed_temp_filename = speed_temp.name
-        
-        # Apply atempo filter to change speed without pitch alteration
-        ffmpeg_cmd = [
-            'ffmpeg',
-            '-y',  # Overwrite output file without prompting
-            '-i', tts_temp_filename,
-            '-filter:a', f'atempo={args.speed}',
-            speed_temp_filename
-        ]
-        
-        try:
-            subprocess.run(ffmpeg_cmd, check=True)
-            audio_clip = AudioFileClip(speed_temp_filename)
-            tts_temp_files.append(speed_temp_filename)
-        except Exception as e:
-            print(f"Error processing audio speed: {e}")
-            audio_clip = AudioFileClip(tts_temp_filename)
+    load_video_backend()
+    
+    # Load text and synthesize narration (unless already started in the background)
+    if narration_future is not None:
+        phrases, tts_filename = narration_future.result()
     else:
-        audio_clip = AudioFileClip(tts_temp_filename)
+        phrases, tts_filename = synthesize_narration(args.text, args.lang, work_dir, args.speed)
+    audio_clip = AudioFileClip(tts_filename)
 
-    # Calculate phrase durations from original speed audio
+    # Calculate phrase durations from the (speed-adjusted) narration audio;
+    # they already sum to the narration length, so no normalization pass is needed.
+    # Only subtitles use them.
     original_audio_duration = audio_clip.duration
-    phrase_durations = calculate_phrase_durations(phrases, args.lang)
-    
-    # Adjust subtitle durations based on speed parameter
-    if args.speed != 1.0:
-        phrase_durations = [d / args.speed for d in phrase_durations]
-
-    total_duration = sum(phrase_durations)
-    
-    # Normalize durations to match audio length
-    if abs(total_duration - audio_clip.duration) > 1:
-        ratio = audio_clip.duration / total_duration
-        phrase_durations = [d * ratio for d in phrase_durations]
+    phrase_durations = calculate_phrase_durations(phrases, original_audio_duration) if args.subtitles else []
+    total_duration = original_audio_duration
 
     # ADJUST IMAGE DURATIONS FOR NARRATION
     # If we have images, reload them with narration duration
     top_files = parse_media_input(args.top_video)
     bottom_files = parse_media_input(args.bottom_video) if args.bottom_video else []
-    has_images = any(is_image_file(f) for f in top_files) or any(is_image_file(f) for f in bottom_files)
+    has_images = any(map(is_image_file, itertools.chain(top_files, bottom_files)))
     
     if has_images:
         # Reload media clips with narration duration
-        new_top_clip, new_bottom_clip = adjust_media_duration_for_narration(args, audio_clip.duration)
+        new_top_clip, new_bottom_clip = adjust_media_duration_for_narration(args, original_audio_duration, work_dir, media_cache)
         
         # Parse resolution for reprocessing
-        target_width, target_height = map(int, args.resolution.split('x'))
+        target_width, target_height = parse_resolution(args.resolution)
         
         if args.bottom_video:
             # Two-media composition - reprocess with narration duration
@@ -1015,33 +1804,33 @@ def add_narration(video_clip: VideoClip, args: argparse.Namespace) -> tuple:
             # Single media - reprocess with narration duration
             video_clip = process_clip(new_top_clip, target_width, target_height)
 
+    # Snapshot the composed video length once for the mixing path below
+    video_duration = video_clip.duration
+
     # Handle video duration requirements
     if args.use_video_length:
-        video_duration = video_clip.duration
-        if audio_clip.duration > video_duration:
+        if original_audio_duration > video_duration:
             audio_clip = audio_clip.subclip(0, video_duration)
         else:
             # Add silence pad if narration is shorter than video
+            # (read-only broadcast of one zero frame, so chunks need no allocation)
+            zero_frame = np.zeros((1, 2), dtype=np.float32)
             silence = AudioClip(
-                lambda t: np.zeros((np.size(t), 2), dtype=np.float32),
-                duration=video_duration - audio_clip.duration,
+                lambda t: np.broadcast_to(zero_frame, (len(t), 2)),
+                duration=video_duration - original_audio_duration,
                 fps=44100
             )
             audio_clip = concatenate_audioclips([audio_clip, silence])
+    audio_duration = audio_clip.duration
 
     # LOOP VIDEO HANDLING FOR SINGLE VIDEO CASE
     if args.bottom_video is None and not args.use_video_length:
         # Calculate required total duration from narration
-        total_duration = audio_clip.duration
+        total_duration = audio_duration
         
-        # Check if video needs looping
-        if video_clip.duration < total_duration:
-            # Calculate number of loops needed
-            loops_needed = math.ceil(total_duration / video_clip.duration)
-            # Create looped video
-            looped_video = concatenate_videoclips([video_clip] * loops_needed)
-            looped_video = looped_video.subclip(0, total_duration)
-            video_clip = looped_video
+        # Loop video if it is shorter than the narration
+        if video_duration < total_duration:
+            video_clip = loop_video(video_clip, total_duration)
 
     # AUDIO PROCESSING WITH MUSIC HANDLING
     audio_tracks = []
@@ -1056,8 +1845,7 @@ def add_narration(video_clip: VideoClip, args: argparse.Namespace) -> tuple:
 
     # BACKGROUND MUSIC HANDLING (added here when narration is present)
     if args.music:
-        music = AudioFileClip(args.music)
-        music_looped = loop_audio(music, total_duration)
+        music_looped = load_looped_music(args.music, total_duration, work_dir)
         music_looped = music_looped.volumex(args.music_volume / 100.0)
         audio_tracks.append(music_looped)
 
@@ -1067,21 +1855,19 @@ def add_narration(video_clip: VideoClip, args: argparse.Namespace) -> tuple:
         narration_duration = original_audio_duration
         
         if args.use_video_length:
-            narration_duration = min(narration_duration, video_clip.duration)
+            narration_duration = min(narration_duration, video_duration)
         
         # Separate music tracks from original audio
         music_tracks = [track for track in audio_tracks if track is not audio_clip]
         original_audio = [track for track in audio_tracks if track is audio_clip]
 
-        # Apply ducking to music tracks
-        ducked_tracks = []
-        for track in music_tracks:
-            if track.duration > narration_duration:
-                ducked = track.subclip(0, narration_duration).volumex(duck_factor)
-                unducked = track.subclip(narration_duration)
-                ducked_tracks.append(concatenate_audioclips([ducked, unducked]))
-            else:
-                ducked_tracks.append(track.volumex(duck_factor))
+        # Apply ducking to music tracks with a gain envelope (duck_factor during narration, 1.0 after);
+        # applied per chunk while mixing, so tracks are never decoded into memory as a whole
+        def duck_frame(get_frame, t):
+            gain = np.where(np.asarray(t) < narration_duration, duck_factor, 1.0)
+            return get_frame(t) * (gain[:, None] if gain.ndim else gain)
+
+        ducked_tracks = [track.fl(duck_frame) for track in music_tracks]
         
         # Rebuild audio tracks
         audio_tracks = original_audio + ducked_tracks
@@ -1091,48 +1877,76 @@ def add_narration(video_clip: VideoClip, args: argparse.Namespace) -> tuple:
 
     # Subtitle generation
     text_clips = []
-    if args.subtitles and phrases:
+    subtitle_file = None
+    if args.subtitles and phrases and getattr(args, 'burn_subtitles', False):
+        # FFmpeg draws the subtitles during export (see export_video)
+        ass_path = os.path.join(work_dir, SUBTITLE_ASS_FILENAME)
+        if write_ass_subtitles(phrases, phrase_durations, args, video_clip.size, ass_path):
+            subtitle_file = ass_path
+    if args.subtitles and phrases and not subtitle_file:
         current_time = 0
-        FONT_SIZE = 60
-        MAX_TEXT_WIDTH = 1000
+        stroke_color = args.text_border_color if args.text_border_color else 'black'  # Default to black if not specified
+        
+        # Render captions in-process with Pillow when possible, otherwise with ImageMagick
+        caption_font = get_caption_font(SUBTITLE_FONT_SIZE)
+        imagemagick_font = get_available_font() if caption_font is None else None
+        baked_captions = {}
         
         for i, (phrase, duration) in enumerate(zip(phrases, phrase_durations)):
             try:
-                # Create text clip with background box
-                try:
-                    txt_clip = TextClip(
-                        phrase,
-                        fontsize=FONT_SIZE,
-                        color=args.text_color,  # Use user-specified color
-                        font=get_available_font(),
-                        stroke_color=args.text_border_color if args.text_border_color else 'black',  # Default to black if not specified
-                        stroke_width=1.5,  # Always have border
-                        size=(MAX_TEXT_WIDTH, None),
-                        method='caption',
-                        align='center'
-                    ).set_duration(duration)
-                except Exception as text_error:
-                    # If TextClip fails, provide helpful error message
-                    if platform.system() == "Windows" and "convert" in str(text_error).lower():
-                        raise Exception(
-                            f"ImageMagick configuration error: {text_error}\n\n"
-                            "This error typically occurs when ImageMagick is not properly configured.\n"
-                            "Solutions:\n"
-                            "1. Run the setup script: setup_windows.bat (as Administrator)\n"
-                            "2. Install ImageMagick manually from: https://imagemagick.org/script/download.php\n"
-                            "3. Ensure 'magick.exe' is in your system PATH\n"
-                            "4. Restart your terminal/command prompt after installation"
-                        )
-                    else:
-                        raise Exception(f"Text clip creation failed: {text_error}")
+                # Phrases repeated in the script reuse their rendered caption
+                txt_clip = baked_captions.get(phrase)
+                if txt_clip is None:
+                    # Create text clip with background box
+                    if caption_font is not None:
+                        try:
+                            txt_clip = render_caption(phrase, caption_font, args.text_color, stroke_color,
+                                                      stroke_width=SUBTITLE_STROKE_WIDTH, max_width=SUBTITLE_MAX_WIDTH).set_duration(duration)
+                        except ValueError:
+                            # Color name unknown to Pillow - let ImageMagick handle it
+                            caption_font = None
+                            imagemagick_font = get_available_font()
+                
+                    try:
+                        if txt_clip is None:
+                            txt_clip = TextClip(
+                                phrase,
+                                fontsize=SUBTITLE_FONT_SIZE,
+                                color=args.text_color,  # Use user-specified color
+                                font=imagemagick_font,
+                                stroke_color=stroke_color,
+                                stroke_width=1.5,  # Always have border
+                                size=(SUBTITLE_MAX_WIDTH, None),
+                                method='caption',
+                                align='center'
+                            ).set_duration(duration)
+                    except Exception as text_error:
+                        # If TextClip fails, provide helpful error message
+                        if platform.system() == "Windows" and "convert" in str(text_error).lower():
+                            raise Exception(
+                                f"ImageMagick configuration error: {text_error}\n\n"
+                                "This error typically occurs when ImageMagick is not properly configured.\n"
+                                "Solutions:\n"
+                                "1. Run the setup script: setup_windows.bat (as Administrator)\n"
+                                "2. Install ImageMagick manually from: https://imagemagick.org/script/download.php\n"
+                                "3. Ensure 'magick.exe' is in your system PATH\n"
+                                "4. Restart your terminal/command prompt after installation"
+                            )
+                        else:
+                            raise Exception(f"Text clip creation failed: {text_error}")
                         
-                    # Create simple text clip without effects as fallback
-                    txt_clip = TextClip(
-                        phrase,
-                        fontsize=FONT_SIZE,
-                        color=args.text_color,
-                        duration=duration
-                    )
+                        # Create simple text clip without effects as fallback
+                        txt_clip = TextClip(
+                            phrase,
+                            fontsize=SUBTITLE_FONT_SIZE,
+                            color=args.text_color,
+                            duration=duration
+                        )
+
+                    # Bake the semi transparent background box (enabled by default) into the text
+                    txt_clip = bake_subtitle_clip(txt_clip, args.bg_box)
+                    baked_captions[phrase] = txt_clip
+                txt_clip = txt_clip.set_duration(duration)
 
                 # Add fade-in and fade-out animation if requested
                 if args.animate_text:
@@ -1142,15 +1956,6 @@ def add_narration(video_clip: VideoClip, args: argparse.Namespace) -> tuple:
                 
                 # Position text clip at center and set timing
                 txt_clip = txt_clip.set_position('center').set_start(current_time)
-                
-                # Conditional semi transparent background box creation
-                if args.bg_box:  # Only create if enabled (default)
-                    bg_clip = ColorClip(
-                        (txt_clip.size[0] + 40, txt_clip.size[1] + 40),
-                        color=(0, 0, 0)
-                    ).set_opacity(0.6).set_duration(duration)
-                    bg_clip = bg_clip.set_position('center').set_start(current_time)
-                    text_clips.append(bg_clip)
 
                 text_clips.append(txt_clip)
                 current_time += duration
@@ -1159,17 +1964,250 @@ def add_narration(video_clip: VideoClip, args: argparse.Namespace) -> tuple:
                 print(f"Error in phrase {i+1}: '{phrase}'")
                 raise
 
-    # Compose final video with subtitles
-    final_video = CompositeVideoClip([video_clip] + text_clips)
+    # Compose final video with subtitles (skip the compositor when there is nothing to overlay)
+    if text_clips:
+        final_video = CompositeVideoClip([video_clip] + text_clips)
+    else:
+        final_video = video_clip
     final_video = final_video.set_audio(final_audio)
 
     # Set final duration based on user preference
     if args.use_video_length:
-        final_video = final_video.set_duration(video_clip.duration)
+        final_video = final_video.set_duration(video_duration)
     else:
-        final_video = final_video.set_duration(audio_clip.duration)
+        final_video = final_video.set_duration(audio_duration)
+
+    return final_video, subtitle_file
+
+@contextlib.contextmanager
+def moviepy_writer_without_preset():
+    """
+    Make MoviePy's video writer, which always passes "-preset <preset>", leave the
+    option out while the context is active. Used for encoders without presets.
+    """
+    from moviepy.video.io import ffmpeg_writer
+    
+    class PresetFilteringSubprocess:
+        def __getattr__(self, name):
+            return getattr(subprocess, name)
+        
+        @staticmethod
+        def Popen(cmd, *args, **kwargs):
+            if '-preset' in cmd:
+                index = cmd.index('-preset')
+                cmd = cmd[:index] + cmd[index + 2:]
+            return subprocess.Popen(cmd, *args, **kwargs)
+    
+    original_sp = ffmpeg_writer.sp
+    ffmpeg_writer.sp = PresetFilteringSubprocess()
+    try:
+        yield
+    finally:
+        ffmpeg_writer.sp = original_sp
 
-    return final_video, tts_temp_files
+def get_video_encoder(hwaccel: str = None) -> tuple:
+    """
+    Select the H.264 encoder and its encoder options.
+    
+    Args:
+        hwaccel: Key of HARDWARE_ENCODERS, or None for software x264
+        
+    Returns:
+        tuple: (codec name, preset or None, list of other FFmpeg encoder options)
+    """
+    if hwaccel:
+        return HARDWARE_ENCODERS[hwaccel]
+    return VIDEO_CODEC, VIDEO_PRESET, VIDEO_QUALITY_PARAMS
+
+def export_video(video_clip: VideoClip, output_path: str, work_dir: str = None, show_progress: bool = True,
+                 hwaccel: str = None, subtitle_file: str = None) -> None:
+    """
+    Encode the final video to an H.264/AAC MP4 file.
+    
+    Args:
+        video_clip: Final composed video clip
+        output_path: Output filename
+        work_dir: Optional scratch directory from create_work_dir for the temporary audio track
+        show_progress: Print MoviePy's progress bar (the GUI shows its own indicator)
+        hwaccel: Hardware encoder key from HARDWARE_ENCODERS, or None for libx264
+        subtitle_file: Optional ASS file from add_narration (--burn-subtitles) to burn in
+    """
+    load_video_backend()
+    
+    codec, preset, encoder_params = get_video_encoder(hwaccel)
+    output_params = encoder_params + VIDEO_FFMPEG_PARAMS
+    
+    if subtitle_file:
+        # Forward slashes keep Windows paths readable; colons and quotes are escaped
+        escaped_path = escape_filter_value(subtitle_file.replace('\\', '/'))
+        output_params = ['-vf', f"subtitles=filename={escaped_path}"] + output_params
+    
+    # The audio track is encoded to a temporary file first; keep it in the scratch
+    # directory (RAM-backed when possible) instead of next to the output
+    temp_audiofile = os.path.join(work_dir, 'export_audio.m4a') if work_dir else None
+    with moviepy_writer_without_preset() if preset is None else contextlib.nullcontext():
+        video_clip.write_videofile(
+            output_path,
+            fps=OUTPUT_FPS,
+            codec=codec,
+            audio_codec="aac",
+            temp_audiofile=temp_audiofile,
+            threads=0,  # Let x264 pick its thread count (frame + slice threads)
+            preset=preset,
+            ffmpeg_params=output_params,
+            write_logfile=False,
+            logger='bar' if show_progress else None
+        )
+
+def can_render_with_ffmpeg(args: argparse.Namespace) -> bool:
+    """
+    Check whether the short can be rendered by a single FFmpeg filter graph without MoviePy.
+    This applies to plain compositions: no narration, no start/end transitions and a
+    single video or static image per half.
+    
+    Args:
+        args: Command-line arguments
+        
+    Returns:
+        bool: True if render_composition_ffmpeg can produce the output
+    """
+    if args.text:
+        return False
+    if getattr(args, 'start_transition', 'none') != 'none' or getattr(args, 'end_transition', 'none') != 'none':
+        return False
+    
+    try:
+        top_files = parse_media_input(args.top_video)
+        bottom_files = parse_media_input(args.bottom_video) if args.bottom_video else []
+    except ValueError:
+        return False
+    
+    if len(top_files) != 1 or len(bottom_files) > 1:
+        return False
+    # Mixing original audio with music uses amix normalize=0, which older FFmpeg lacks
+    if args.audio and args.music and not ffmpeg_filter_has_option('amix', 'normalize'):
+        return False
+    return not any(is_animated_gif(f) for f in top_files + bottom_files)
+
+def can_stream_copy(args: argparse.Namespace) -> bool:
+    """
+    Check whether the output would just re-encode the main video unchanged: a single
+    H.264 video already at the target resolution and frame rate, with no second half,
+    music or original audio. Such inputs can be remuxed without encoding, provided the
+    stream plays like an encoded one: yuv420p, square pixels, no rotation and a
+    profile no higher than High.
+    
+    Args:
+        args: Command-line arguments (already accepted by can_render_with_ffmpeg)
+        
+    Returns:
+        bool: True if the video stream can be copied as-is
+    """
+    if args.bottom_video or args.music or args.audio:
+        return False
+    top_file = parse_media_input(args.top_video)[0]
+    if is_image_file(top_file):
+        return False
+    
+    try:
+        # ffprobe prints the fields in its own order, not the requested one
+        codec_name, profile, width, height, sample_aspect_ratio, pix_fmt, frame_rate = probe_stream(
+            top_file, 'v:0', 'codec_name,profile,width,height,sample_aspect_ratio,pix_fmt,avg_frame_rate')[:7]
+        numerator, denominator = frame_rate.split('/')
+        fps = int(numerator) / int(denominator)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return False
+    
+    if not (codec_name == 'h264' and (int(width), int(height)) == parse_resolution(args.resolution)
+            and abs(fps - OUTPUT_FPS) < 0.01 and pix_fmt == 'yuv420p'
+            and profile in ('Constrained Baseline', 'Baseline', 'Main', 'High')
+            # An unset aspect ratio (N/A or 0:1) also means square pixels
+            and sample_aspect_ratio in ('1:1', '0:1', 'N/A')):
+        return False
+    
+    # Rotated phone videos carry a rotate tag or display matrix; encoding applies it
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+             '-show_entries', 'stream_tags=rotate:stream_side_data=rotation',
+             '-of', 'default=nw=1:nk=1', top_file],
+            capture_output=True, text=True, check=True
+        )
+        return all(float(value) % 360 == 0 for value in result.stdout.split())
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return False
+
+def render_composition_ffmpeg(args: argparse.Namespace) -> None:
+    """
+    Render a plain composition with one FFmpeg invocation: decode, scale, center-crop,
+    stack, loop and mix audio natively instead of passing frames through Python.
+    Mirrors create_video_short for inputs accepted by can_render_with_ffmpeg.
+    
+    Args:
+        args: Command-line arguments
+    """
+    load_video_backend()
+    
+    # Nothing to change in the picture: copy the video stream into the new container
+    if can_stream_copy(args):
+        cmd = ['ffmpeg', '-y', '-i', parse_media_input(args.top_video)[0], '-map', '0:v:0', '-c:v', 'copy', '-an']
+        subprocess.run(cmd + VIDEO_FFMPEG_PARAMS + [args.output], check=True)
+        return
+    
+    target_width, target_height = parse_resolution(args.resolution)
+    media_files = parse_media_input(args.top_video)
+    if args.bottom_video:
+        media_files += parse_media_input(args.bottom_video)
+    box_height = target_height // 2 if len(media_files) > 1 else target_height
+    image_duration = getattr(args, 'image_duration', 5.0)
+    
+    cmd = ['ffmpeg', '-y']
+    filters = []
+    durations = []
+    top_has_audio = False
+    for index, filepath in enumerate(media_files):
+        if is_image_file(filepath):
+            cmd += ['-loop', '1', '-i', filepath]
+            durations.append(image_duration)
+        else:
+            infos = ffmpeg_parse_infos(filepath)
+            cmd += ['-stream_loop', '-1', '-i', filepath]  # Shorter half loops like loop_video
+            durations.append(infos['duration'])
+            if index == 0:
+                top_has_audio = infos.get('audio_found', False)
+        # Aspect-preserving scale and center crop, as in process_clip
+        filters.append(f"[{index}:v]scale={target_width}:{box_height}:force_original_aspect_ratio=increase,"
+                       f"crop={target_width}:{box_height},setsar=1,fps={OUTPUT_FPS}[v{index}]")
+    total_duration = max(durations)
+    
+    if len(media_files) > 1:
+        filters.append("[v0][v1]vstack=inputs=2[vout]")
+    else:
+        filters[-1] = filters[-1].replace("[v0]", "[vout]")
+    
+    # Audio mixing: original top audio and looped background music
+    audio_labels = []
+    if args.audio and top_has_audio:
+        audio_labels.append("[0:a]")
+    if args.music:
+        cmd += ['-stream_loop', '-1', '-i', args.music]
+        filters.append(f"[{len(media_files)}:a]volume={args.music_volume / 100.0}[music]")
+        audio_labels.append("[music]")
+    if len(audio_labels) > 1:
+        # Plain sum like CompositeAudioClip (no amix normalization)
+        filters.append("".join(audio_labels) + f"amix=inputs={len(audio_labels)}:duration=longest:normalize=0[aout]")
+        audio_map = ['-map', '[aout]']
+    elif audio_labels:
+        filters.append(f"{audio_labels[0]}anull[aout]")
+        audio_map = ['-map', '[aout]']
+    else:
+        audio_map = ['-an']
+    
+    cmd += ['-filter_complex', ";".join(filters), '-map', '[vout]'] + audio_map
+    codec, preset, encoder_params = get_video_encoder(getattr(args, 'hwaccel', None))
+    cmd += ['-t', str(total_duration), '-c:v', codec] + (['-preset', preset] if preset else []) + encoder_params
+    cmd += VIDEO_FFMPEG_PARAMS + ['-c:a', 'aac', args.output]
+    subprocess.run(cmd, check=True)
 
 class ShortMakerGUI:
     """Graphical User Interface for Short Maker"""
@@ -1212,6 +2250,7 @@ class ShortMakerGUI:
         self.text_var = tk.StringVar()
         self.output_var = tk.StringVar(value="output.mp4")
         self.resolution_var = tk.StringVar(value="1080x1920")
+        self.hwaccel_var = tk.StringVar(value="none")
         self.lang_var = tk.StringVar(value="en")
         self.music_volume_var = tk.DoubleVar(value=100.0)
         self.video_volume_var = tk.DoubleVar(value=0.0)
@@ -1233,12 +2272,36 @@ class ShortMakerGUI:
         self.use_video_length_var = tk.BooleanVar(value=False)
         self.animate_text_var = tk.BooleanVar(value=False)
         self.bg_box_var = tk.BooleanVar(value=True)
+        self.burn_subtitles_var = tk.BooleanVar(value=False)
+        
+        # Pending debounced entry callbacks (after id per variable)
+        self.pending_callbacks = {}
+        
+        # Parsed top media files and the currently shown media option rows
+        # (see update_image_duration_visibility)
+        self.top_media_files = []
+        self.media_layout = None
+        
+        # Shared tooltip window, created on first use (see show_tooltip_window)
+        self.tooltip_window = None
+        self.tooltip_label = None
+        self.tooltip_hide_id = None
         
         self.create_widgets()
         
         # Auto-adjust window width to content after widgets are created
         self.root.after(100, self.auto_resize_width)
         
+        # Import the video libraries in the background once the window is shown
+        self.root.after(500, lambda: threading.Thread(target=self.preload_video_backend, daemon=True).start())
+        
+    def preload_video_backend(self):
+        """Import the video libraries ahead of the first Create click"""
+        try:
+            load_video_backend()
+        except Exception:
+            pass  # Import errors are reported when a video is created
+        
     def auto_resize_width(self):
         """Automatically adjust window width to fit content perfectly"""
         self.root.update_idletasks()
@@ -1315,27 +2378,27 @@ class ShortMakerGUI:
         # Image duration (initially hidden)
         self.image_duration_label = ttk.Label(video_frame, text="Image Duration (seconds):")
         self.image_duration_scale = ttk.Scale(video_frame, from_=1.0, to=30.0, variable=self.image_duration_var, orient=tk.HORIZONTAL)
-        self.image_duration_value_label = ttk.Label(video_frame, textvariable=self.image_duration_var)
+        self.image_duration_value_label = self.create_value_label(video_frame, self.image_duration_var)
         self.image_duration_tooltip = ttk.Label(video_frame, text="ℹ️", foreground="blue")
         
         # Transition controls (initially hidden)
         self.transition_label = ttk.Label(video_frame, text="Transition Type:")
         self.transition_combo = ttk.Combobox(video_frame, textvariable=self.transition_type_var,
-                                           values=["none", "fade", "slide_left", "slide_right", "slide_up", "slide_down", "zoom_in", "zoom_out"],
+                                           values=TRANSITION_TYPES,
                                            state="readonly")
         self.transition_duration_label = ttk.Label(video_frame, text="Transition Duration (seconds):")
         self.transition_duration_scale = ttk.Scale(video_frame, from_=0.1, to=2.0, variable=self.transition_duration_var, orient=tk.HORIZONTAL)
-        self.transition_duration_value_label = ttk.Label(video_frame, textvariable=self.transition_duration_var)
+        self.transition_duration_value_label = self.create_value_label(video_frame, self.transition_duration_var)
         self.transition_tooltip = ttk.Label(video_frame, text="ℹ️", foreground="blue")
         
         # Start/End transition controls (initially hidden)
         self.start_transition_label = ttk.Label(video_frame, text="Start Transition:")
         self.start_transition_combo = ttk.Combobox(video_frame, textvariable=self.start_transition_var,
-                                                 values=["none", "fade", "slide_left", "slide_right", "slide_up", "slide_down", "zoom_in", "zoom_out"],
+                                                 values=TRANSITION_TYPES,
                                                  state="readonly")
         self.end_transition_label = ttk.Label(video_frame, text="End Transition:")
         self.end_transition_combo = ttk.Combobox(video_frame, textvariable=self.end_transition_var,
-                                               values=["none", "fade", "slide_left", "slide_right", "slide_up", "slide_down", "zoom_in", "zoom_out"],
+                                               values=TRANSITION_TYPES,
                                                state="readonly")
         self.start_end_tooltip = ttk.Label(video_frame, text="ℹ️", foreground="blue")
         
@@ -1386,12 +2449,12 @@ class ShortMakerGUI:
         ttk.Label(audio_frame, text="Music Volume (%):").grid(row=2, column=0, sticky=tk.W, pady=2)
         music_vol_scale = ttk.Scale(audio_frame, from_=0, to=200, variable=self.music_volume_var, orient=tk.HORIZONTAL)
         music_vol_scale.grid(row=2, column=1, sticky=tk.EW, padx=5)
-        ttk.Label(audio_frame, textvariable=self.music_volume_var).grid(row=2, column=2, padx=5)
+        self.create_value_label(audio_frame, self.music_volume_var).grid(row=2, column=2, padx=5)
         
         ttk.Label(audio_frame, text="Video Volume (%):").grid(row=3, column=0, sticky=tk.W, pady=2)
         video_vol_scale = ttk.Scale(audio_frame, from_=0, to=200, variable=self.video_volume_var, orient=tk.HORIZONTAL)
         video_vol_scale.grid(row=3, column=1, sticky=tk.EW, padx=5)
-        ttk.Label(audio_frame, textvariable=self.video_volume_var).grid(row=3, column=2, padx=5)
+        self.create_value_label(audio_frame, self.video_volume_var).grid(row=3, column=2, padx=5)
         
         # Audio ducking
         duck_frame = ttk.Frame(audio_frame)
@@ -1402,7 +2465,7 @@ class ShortMakerGUI:
         duck_scale = ttk.Scale(duck_frame, from_=0, to=100, variable=self.duck_volume_var, 
                               orient=tk.HORIZONTAL, length=100)
         duck_scale.pack(side=tk.LEFT, padx=5)
-        ttk.Label(duck_frame, textvariable=self.duck_volume_var).pack(side=tk.LEFT, padx=5)
+        self.create_value_label(duck_frame, self.duck_volume_var).pack(side=tk.LEFT, padx=5)
         
         # Narration Section
         narration_frame = ttk.LabelFrame(scrollable_frame, text="🎤 Narration & Subtitles", padding=10)
@@ -1418,7 +2481,7 @@ class ShortMakerGUI:
         # Language
         ttk.Label(narration_frame, text="Language:").grid(row=1, column=0, sticky=tk.W, pady=2)
         lang_combo = ttk.Combobox(narration_frame, textvariable=self.lang_var, 
-                                 values=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh", "pl"])
+                                 values=LANGUAGE_CHOICES)
         lang_combo.grid(row=1, column=1, sticky=tk.EW, padx=5)
         self.create_tooltip(narration_frame, "Language code for text-to-speech", row=1, col=3)
         
@@ -1426,7 +2489,7 @@ class ShortMakerGUI:
         ttk.Label(narration_frame, text="Narration Speed:").grid(row=2, column=0, sticky=tk.W, pady=2)
         speed_scale = ttk.Scale(narration_frame, from_=0.5, to=2.0, variable=self.speed_var, orient=tk.HORIZONTAL)
         speed_scale.grid(row=2, column=1, sticky=tk.EW, padx=5)
-        ttk.Label(narration_frame, textvariable=self.speed_var).grid(row=2, column=2, padx=5)
+        self.create_value_label(narration_frame, self.speed_var, "{:.2f}").grid(row=2, column=2, padx=5)
         
         # Subtitle options
         ttk.Checkbutton(narration_frame, text="Enable subtitles", 
@@ -1446,21 +2509,24 @@ class ShortMakerGUI:
         ttk.Label(subtitle_frame, text="Fade Duration (seconds):").grid(row=1, column=0, sticky=tk.W, pady=2)
         fade_scale = ttk.Scale(subtitle_frame, from_=0.0, to=1.0, variable=self.fade_duration_var, orient=tk.HORIZONTAL)
         fade_scale.grid(row=1, column=1, sticky=tk.EW, padx=5)
-        ttk.Label(subtitle_frame, textvariable=self.fade_duration_var).grid(row=1, column=2, padx=5)
+        self.create_value_label(subtitle_frame, self.fade_duration_var, "{:.2f}").grid(row=1, column=2, padx=5)
         
         # Text colors
         ttk.Label(subtitle_frame, text="Text Color:").grid(row=2, column=0, sticky=tk.W, pady=2)
         color_combo = ttk.Combobox(subtitle_frame, textvariable=self.text_color_var, 
-                                  values=["white", "black", "red", "blue", "green", "yellow", "cyan", "magenta"])
+                                  values=TEXT_COLOR_CHOICES)
         color_combo.grid(row=2, column=1, sticky=tk.EW, padx=5)
         
         ttk.Label(subtitle_frame, text="Border Color:").grid(row=3, column=0, sticky=tk.W, pady=2)
         border_combo = ttk.Combobox(subtitle_frame, textvariable=self.text_border_color_var, 
-                                   values=["black", "white", "red", "blue", "green", "yellow", "cyan", "magenta"])
+                                   values=BORDER_COLOR_CHOICES)
         border_combo.grid(row=3, column=1, sticky=tk.EW, padx=5)
         
         ttk.Checkbutton(subtitle_frame, text="Show background box behind text", 
                        variable=self.bg_box_var).grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=2)
+        ttk.Checkbutton(subtitle_frame, text="Burn subtitles with FFmpeg (faster export)", 
+                       variable=self.burn_subtitles_var).grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=2)
+        self.create_tooltip(subtitle_frame, "Draw subtitles with FFmpeg/libass while encoding instead of compositing them frame by frame", row=5, col=3)
         
         # Output Section
         output_frame = ttk.LabelFrame(scrollable_frame, text="📤 Output Settings", padding=10)
@@ -1477,10 +2543,17 @@ class ShortMakerGUI:
         # Resolution
         ttk.Label(output_frame, text="Resolution:").grid(row=1, column=0, sticky=tk.W, pady=2)
         res_combo = ttk.Combobox(output_frame, textvariable=self.resolution_var, 
-                                values=["1080x1920", "720x1280", "1920x1080", "1280x720", "640x480"])
+                                values=RESOLUTION_CHOICES)
         res_combo.grid(row=1, column=1, sticky=tk.EW, padx=5)
         self.create_tooltip(output_frame, "Video resolution (width x height)", row=1, col=3)
         
+        # Hardware encoder
+        ttk.Label(output_frame, text="Hardware Encoder:").grid(row=2, column=0, sticky=tk.W, pady=2)
+        hwaccel_combo = ttk.Combobox(output_frame, textvariable=self.hwaccel_var,
+                                    values=("none",) + tuple(HARDWARE_ENCODERS), state="readonly")
+        hwaccel_combo.grid(row=2, column=1, sticky=tk.EW, padx=5)
+        self.create_tooltip(output_frame, "Encode on the GPU (NVIDIA, Intel, Apple or AMD) instead of the CPU", row=2, col=3)
+        
         # Progress and Control Section
         control_frame = ttk.LabelFrame(scrollable_frame, text="🎬 Create Video", padding=10)
         control_frame.pack(fill=tk.X, pady=(0, 10), padx=5)
@@ -1533,50 +2606,63 @@ class ShortMakerGUI:
         
         # Bind mousewheel to canvas
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            # One unit per wheel tick (also for macOS, where delta is not a multiple of 120)
+            canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+        
+        # Only route wheel events here while the pointer is over the form
+        def bind_mousewheel(event):
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        
+        def unbind_mousewheel(event):
+            # Leave also fires when the pointer moves onto a widget inside the canvas
+            try:
+                widget = canvas.winfo_containing(event.x_root, event.y_root)
+            except KeyError:
+                widget = None
+            if widget is None or not str(widget).startswith(str(canvas)):
+                canvas.unbind_all("<MouseWheel>")
+        
+        canvas.bind("<Enter>", bind_mousewheel)
+        canvas.bind("<Leave>", unbind_mousewheel)
         
         # Initialize image duration visibility
         self.update_image_duration_visibility()
         
+    def create_value_label(self, parent, var, value_format="{:.1f}"):
+        """Create a label showing a slider value, redrawn at most every 50 ms while dragging"""
+        display_var = tk.StringVar(value=value_format.format(var.get()))
+        pending_id = None
+        
+        def refresh():
+            nonlocal pending_id
+            pending_id = None
+            display_var.set(value_format.format(var.get()))
+        
+        def schedule_refresh(*args):
+            nonlocal pending_id
+            if pending_id is None:
+                pending_id = self.root.after(50, refresh)
+        
+        var.trace('w', schedule_refresh)
+        return ttk.Label(parent, textvariable=display_var)
+        
     def create_file_selector(self, parent, var, title, file_type, extensions, row, col, callback=None):
         """Create a file selector with entry and browse button"""
         entry = ttk.Entry(parent, textvariable=var)
         entry.grid(row=row, column=col, sticky=tk.EW, padx=5)
         
         def browse():
-            # Check if this is for media files (support multiple selection)
+            # Media files support multiple selection (the same dialog also accepts a single file)
             if "Media files" in file_type:
-                # Ask user if they want single or multiple files
-                choice = messagebox.askyesnocancel(
-                    "File Selection", 
-                    "Do you want to select multiple files?\n\n"
-                    "Yes = Multiple files (for image sequences)\n"
-                    "No = Single file\n"
-                    "Cancel = Cancel selection"
+                filenames = filedialog.askopenfilenames(
+                    title=title + " (one or more)",
+                    filetypes=[(file_type, extensions), ("All files", "*.*")]
                 )
-                
-                if choice is None:  # Cancel
-                    return
-                elif choice:  # Multiple files
-                    filenames = filedialog.askopenfilenames(
-                        title=title + " (Multiple)",
-                        filetypes=[(file_type, extensions), ("All files", "*.*")]
-                    )
-                    if filenames:
-                        # Join multiple files with semicolons
-                        var.set(';'.join(filenames))
-                        if callback:
-                            callback()
-                else:  # Single file
-                    filename = filedialog.askopenfilename(
-                        title=title,
-                        filetypes=[(file_type, extensions), ("All files", "*.*")]
-                    )
-                    if filename:
-                        var.set(filename)
-                        if callback:
-                            callback()
+                if filenames:
+                    # Join multiple files with semicolons
+                    var.set(';'.join(filenames))
+                    if callback:
+                        callback()
             else:
                 # Non-media files - single selection only
                 filename = filedialog.askopenfilename(
@@ -1588,9 +2674,16 @@ class ShortMakerGUI:
                     if callback:
                         callback()
         
-        # Also add callback to entry changes
+        # Also add callback to entry changes, debounced so typing or pasting a long
+        # path list re-parses the inputs once after a short pause, not per keystroke
         if callback:
-            var.trace('w', lambda *args: callback())
+            def schedule_callback(*args):
+                pending = self.pending_callbacks.get(str(var))
+                if pending:
+                    self.root.after_cancel(pending)
+                self.pending_callbacks[str(var)] = self.root.after(150, callback)
+            
+            var.trace('w', schedule_callback)
         
         ttk.Button(parent, text="Browse", command=browse).grid(row=row, column=col+1, padx=5)
         
@@ -1605,7 +2698,7 @@ class ShortMakerGUI:
             bottom_files = parse_media_input(bottom_input) if bottom_input else []
             
             # Check if any files are images
-            has_images = any(is_image_file(f) for f in top_files) or any(is_image_file(f) for f in bottom_files)
+            has_images = any(map(is_image_file, itertools.chain(top_files, bottom_files)))
             # Check if there are multiple files (for transitions)
             has_multiple_files = len(top_files) > 1 or len(bottom_files) > 1
             # Check if there are any files (for start/end transitions)
@@ -1616,11 +2709,20 @@ class ShortMakerGUI:
             should_show_start_end_transitions = has_any_files
         except:
             # If parsing fails, check simple case
-            should_show_duration = (top_input and is_image_file(top_input))
+            should_show_duration = bool(top_input and is_image_file(top_input))
             should_show_transitions = False
             should_show_start_end_transitions = bool(top_input)
             top_files = []
         
+        # Remember the top files for the image duration tooltip
+        self.top_media_files = top_files
+        
+        # Only touch the grid when the set of visible rows actually changes
+        layout = (should_show_duration, should_show_transitions, should_show_start_end_transitions)
+        if layout == self.media_layout:
+            return
+        self.media_layout = layout
+        
         # Show/hide image duration controls
         if should_show_duration:
             self.image_duration_label.grid(row=2, column=0, sticky=tk.W, pady=2)
@@ -1630,23 +2732,13 @@ class ShortMakerGUI:
             
             # Bind tooltip
             def show_duration_tooltip(event):
-                tooltip = tk.Toplevel()
-                tooltip.wm_overrideredirect(True)
-                tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-                
                 # Update tooltip text for multiple files
                 tooltip_text = "Duration per image file. For multiple images: total duration = count × duration. Animated GIFs loop automatically to fill the duration."
-                if len(top_files) > 1:
-                    tooltip_text += f"\nTop files: {len(top_files)} images × {self.image_duration_var.get():.1f}s = {len(top_files) * self.image_duration_var.get():.1f}s total"
-                
-                label = ttk.Label(tooltip, text=tooltip_text, 
-                                 background="lightyellow", relief="solid", borderwidth=1, wraplength=250)
-                label.pack()
-                
-                def hide_tooltip():
-                    tooltip.destroy()
+                top_count = len(self.top_media_files)
+                if top_count > 1:
+                    tooltip_text += f"\nTop files: {top_count} images × {self.image_duration_var.get():.1f}s = {top_count * self.image_duration_var.get():.1f}s total"
                 
-                tooltip.after(4000, hide_tooltip)
+                self.show_tooltip_window(tooltip_text, event.x_root, event.y_root, 4000)
                 
             self.image_duration_tooltip.bind("<Button-1>", show_duration_tooltip)
         else:
@@ -1668,24 +2760,13 @@ class ShortMakerGUI:
             
             # Bind transition tooltip
             def show_transition_tooltip(event):
-                tooltip = tk.Toplevel()
-                tooltip.wm_overrideredirect(True)
-                tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-                
                 tooltip_text = "Transition effects between multiple media files:\n"
                 tooltip_text += "• none: No transition\n"
                 tooltip_text += "• fade: Fade in/out\n"
                 tooltip_text += "• slide_*: Slide from direction\n"
                 tooltip_text += "• zoom_*: Zoom in/out effect"
                 
-                label = ttk.Label(tooltip, text=tooltip_text, 
-                                 background="lightyellow", relief="solid", borderwidth=1, wraplength=300)
-                label.pack()
-                
-                def hide_tooltip():
-                    tooltip.destroy()
-                
-                tooltip.after(5000, hide_tooltip)
+                self.show_tooltip_window(tooltip_text, event.x_root, event.y_root, 5000, wraplength=300)
                 
             self.transition_tooltip.bind("<Button-1>", show_transition_tooltip)
         else:
@@ -1708,10 +2789,6 @@ class ShortMakerGUI:
             
             # Bind start/end transition tooltip
             def show_start_end_tooltip(event):
-                tooltip = tk.Toplevel()
-                tooltip.wm_overrideredirect(True)
-                tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-                
                 tooltip_text = "Start/End transitions for the entire video:\n"
                 tooltip_text += "• Start: Effect at beginning of the short\n"
                 tooltip_text += "• End: Effect at end of the short\n"
@@ -1720,14 +2797,7 @@ class ShortMakerGUI:
                 tooltip_text += "• For best results, use 'fade' transitions\n"
                 tooltip_text += "• May impact performance on very long videos"
                 
-                label = ttk.Label(tooltip, text=tooltip_text, 
-                                 background="lightyellow", relief="solid", borderwidth=1, wraplength=300)
-                label.pack()
-                
-                def hide_tooltip():
-                    tooltip.destroy()
-                
-                tooltip.after(6000, hide_tooltip)
+                self.show_tooltip_window(tooltip_text, event.x_root, event.y_root, 6000, wraplength=300)
                 
             self.start_end_tooltip.bind("<Button-1>", show_start_end_tooltip)
         else:
@@ -1741,47 +2811,45 @@ class ShortMakerGUI:
         help_label.grid(row=row, column=col, padx=5)
         
         def show_tooltip(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            
-            # Calculate tooltip position to stay on screen
-            screen_width = tooltip.winfo_screenwidth()
-            screen_height = tooltip.winfo_screenheight()
-            
-            # Initial position
-            x = event.x_root + 10
-            y = event.y_root + 10
-            
-            # Create a temporary label to measure size
-            temp_label = ttk.Label(tooltip, text=text, wraplength=250)
-            temp_label.pack()
-            tooltip.update_idletasks()
-            
-            tooltip_width = tooltip.winfo_reqwidth()
-            tooltip_height = tooltip.winfo_reqheight()
-            
-            # Adjust position if tooltip would go off-screen
-            if x + tooltip_width > screen_width:
-                x = event.x_root - tooltip_width - 10
-            if y + tooltip_height > screen_height:
-                y = event.y_root - tooltip_height - 10
-            
-            # Ensure tooltip stays on screen
-            x = max(0, min(x, screen_width - tooltip_width))
-            y = max(0, min(y, screen_height - tooltip_height))
-            
-            tooltip.wm_geometry(f"+{x}+{y}")
-            
-            # Configure the actual label
-            temp_label.configure(background="lightyellow", relief="solid", borderwidth=1)
-            
-            def hide_tooltip():
-                tooltip.destroy()
-            
-            tooltip.after(4000, hide_tooltip)  # Auto-hide after 4 seconds
+            self.show_tooltip_window(text, event.x_root, event.y_root, 4000)  # Auto-hide after 4 seconds
             
         help_label.bind("<Button-1>", show_tooltip)
         
+    def show_tooltip_window(self, text, x_root, y_root, hide_after, wraplength=250):
+        """Show the shared tooltip window next to the pointer, kept on screen"""
+        if self.tooltip_window is None:
+            # One window reused for every tooltip instead of a new Toplevel per click
+            self.tooltip_window = tk.Toplevel(self.root)
+            self.tooltip_window.wm_overrideredirect(True)
+            self.tooltip_window.withdraw()
+            self.tooltip_label = ttk.Label(self.tooltip_window, background="lightyellow", relief="solid", borderwidth=1)
+            self.tooltip_label.pack()
+        elif self.tooltip_hide_id:
+            self.root.after_cancel(self.tooltip_hide_id)
+        
+        self.tooltip_label.configure(text=text, wraplength=wraplength)
+        self.tooltip_window.update_idletasks()
+        
+        # Calculate tooltip position to stay on screen
+        screen_width = self.tooltip_window.winfo_screenwidth()
+        screen_height = self.tooltip_window.winfo_screenheight()
+        tooltip_width = self.tooltip_window.winfo_reqwidth()
+        tooltip_height = self.tooltip_window.winfo_reqheight()
+        
+        x = x_root + 10
+        y = y_root + 10
+        if x + tooltip_width > screen_width:
+            x = x_root - tooltip_width - 10
+        if y + tooltip_height > screen_height:
+            y = y_root - tooltip_height - 10
+        x = max(0, min(x, screen_width - tooltip_width))
+        y = max(0, min(y, screen_height - tooltip_height))
+        
+        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        self.tooltip_window.deiconify()
+        self.tooltip_window.lift()
+        self.tooltip_hide_id = self.root.after(hide_after, self.tooltip_window.withdraw)
+        
     def select_output_file(self):
         """Select output file location"""
         filename = filedialog.asksaveasfilename(
@@ -1803,10 +2871,8 @@ class ShortMakerGUI:
         text_widget = scrolledtext.ScrolledText(preview_window, wrap=tk.WORD)
         text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        preview_text = "Current Settings:\n\n"
-        for key, value in settings.items():
-            preview_text += f"{key}: {value}\n"
-            
+        preview_text = "Current Settings:\n\n" + "".join(f"{key}: {value}\n" for key, value in settings.items())
+        
         text_widget.insert(tk.END, preview_text)
         text_widget.config(state=tk.DISABLED)
         
@@ -1819,6 +2885,7 @@ class ShortMakerGUI:
             "Text File": self.text_var.get() or "None",
             "Output File": self.output_var.get(),
             "Resolution": self.resolution_var.get(),
+            "Hardware Encoder": self.hwaccel_var.get(),
             "Language": self.lang_var.get(),
             "Music Volume": f"{self.music_volume_var.get():.1f}%",
             "Video Volume": f"{self.video_volume_var.get():.1f}%",
@@ -1833,6 +2900,7 @@ class ShortMakerGUI:
             "Text Color": self.text_color_var.get(),
             "Border Color": self.text_border_color_var.get(),
             "Background Box": self.bg_box_var.get(),
+            "Burn Subtitles": self.burn_subtitles_var.get(),
             "Image Duration": f"{self.image_duration_var.get():.1f}s",
             "Transition Type": self.transition_type_var.get(),
             "Transition Duration": f"{self.transition_duration_var.get():.1f}s",
@@ -1849,6 +2917,7 @@ class ShortMakerGUI:
             self.text_var.set("")
             self.output_var.set("output.mp4")
             self.resolution_var.set("1080x1920")
+            self.hwaccel_var.set("none")
             self.lang_var.set("en")
             self.music_volume_var.set(100.0)
             self.video_volume_var.set(0.0)
@@ -1863,6 +2932,7 @@ class ShortMakerGUI:
             self.use_video_length_var.set(False)
             self.animate_text_var.set(False)
             self.bg_box_var.set(True)
+            self.burn_subtitles_var.set(False)
             self.image_duration_var.set(5.0)
             self.transition_type_var.set("none")
             self.transition_duration_var.set(0.5)
@@ -1871,22 +2941,24 @@ class ShortMakerGUI:
             
     def export_command(self):
         """Export current settings as CLI command"""
+        # Read every setting once (each variable get is a Tcl round-trip)
+        args = self.create_args_object()
+        
         # Validate required fields
-        if not self.top_video_var.get():
+        if not args.top_video:
             messagebox.showerror("Error", "Please select a main video file first!")
             return
             
+        # Rescan media inputs in case files or directories changed since the last run
+        scan_media_input.cache_clear()
+        
         # Validate main media files exist
         try:
-            top_files = parse_media_input(self.top_video_var.get())
+            top_files = parse_media_input(args.top_video)
+            # (parse_media_input has already checked that every file exists)
             if not top_files:
                 messagebox.showerror("Error", "No valid main media files found!")
                 return
-            
-            missing_files = [f for f in top_files if not os.path.exists(f)]
-            if missing_files:
-                messagebox.showerror("Error", f"Main media files not found:\n" + "\n".join(missing_files))
-                return
         except Exception as e:
             messagebox.showerror("Error", f"Error parsing main media input: {str(e)}")
             return
@@ -1895,81 +2967,51 @@ class ShortMakerGUI:
         cmd_parts = ["python", "short-maker.py"]
         
         # Add main video (required)
-        cmd_parts.append(f'"{self.top_video_var.get()}"')
+        cmd_parts.append(args.top_video)
         
         # Add secondary video if specified
-        if self.bottom_video_var.get():
-            cmd_parts.append(f'"{self.bottom_video_var.get()}"')
-        
-        # Add optional parameters
-        if self.music_var.get():
-            cmd_parts.extend(["-m", f'"{self.music_var.get()}"'])
-            
-        if self.text_var.get():
-            cmd_parts.extend(["-t", f'"{self.text_var.get()}"'])
-            
-        if self.output_var.get() != "output.mp4":
-            cmd_parts.extend(["-o", f'"{self.output_var.get()}"'])
-            
-        if self.resolution_var.get() != "1080x1920":
-            cmd_parts.extend(["-r", self.resolution_var.get()])
-            
-        if self.lang_var.get() != "en":
-            cmd_parts.extend(["-l", self.lang_var.get()])
-            
-        if self.music_volume_var.get() != 100.0:
-            cmd_parts.extend(["-mv", str(self.music_volume_var.get())])
-            
-        if self.video_volume_var.get() != 0.0:
-            cmd_parts.extend(["-vv", str(self.video_volume_var.get())])
-            
-        if self.speed_var.get() != 1.0:
-            cmd_parts.extend(["-s", str(self.speed_var.get())])
-            
-        if self.fade_duration_var.get() != 0.15:
-            cmd_parts.extend(["--fade-duration", str(self.fade_duration_var.get())])
-            
-        if self.text_color_var.get() != "white":
-            cmd_parts.extend(["--text-color", self.text_color_var.get()])
-            
-        if self.text_border_color_var.get() != "black":
-            cmd_parts.extend(["--text-border-color", self.text_border_color_var.get()])
-            
-        if self.image_duration_var.get() != 5.0:
-            cmd_parts.extend(["--image-duration", str(self.image_duration_var.get())])
-            
-        if self.transition_type_var.get() != "none":
-            cmd_parts.extend(["--transition-type", self.transition_type_var.get()])
-            
-        if self.transition_duration_var.get() != 0.5:
-            cmd_parts.extend(["--transition-duration", str(self.transition_duration_var.get())])
-            
-        if self.start_transition_var.get() != "none":
-            cmd_parts.extend(["--start-transition", self.start_transition_var.get()])
-            
-        if self.end_transition_var.get() != "none":
-            cmd_parts.extend(["--end-transition", self.end_transition_var.get()])
+        if args.bottom_video:
+            cmd_parts.append(args.bottom_video)
+        
+        # Add optional parameters that differ from the CLI defaults: (flag, value, default)
+        options = [
+            ("-m", args.music, None),
+            ("-t", args.text, None),
+            ("-o", args.output, "output.mp4"),
+            ("-r", args.resolution, "1080x1920"),
+            ("--hwaccel", args.hwaccel, None),
+            ("-l", args.lang, "en"),
+            ("-mv", args.music_volume, 100.0),
+            ("-vv", args.video_volume, 0.0),
+            ("-s", args.speed, 1.0),
+            ("--fade-duration", args.fade_duration, 0.15),
+            ("--text-color", args.text_color, "white"),
+            ("--text-border-color", args.text_border_color, "black"),
+            ("--image-duration", args.image_duration, 5.0),
+            ("--transition-type", args.transition_type, "none"),
+            ("--transition-duration", args.transition_duration, 0.5),
+            ("--start-transition", args.start_transition, "none"),
+            ("--end-transition", args.end_transition, "none"),
+            ("--duck-volume", args.duck_volume, None),
+        ]
+        cmd_parts += [part for flag, value, default in options if value != default for part in (flag, str(value))]
         
         # Add boolean flags
-        if self.audio_var.get():
-            cmd_parts.append("-a")
-            
-        if not self.subtitles_var.get():
-            cmd_parts.append("-ns")
-            
-        if self.duck_enabled_var.get():
-            cmd_parts.extend(["--duck-volume", str(self.duck_volume_var.get())])
-            
-        if self.use_video_length_var.get():
-            cmd_parts.append("--use-video-length")
-            
-        if self.animate_text_var.get():
-            cmd_parts.append("--animate-text")
-            
-        if not self.bg_box_var.get():
-            cmd_parts.append("--no-bg-box")
+        flags = [
+            ("-a", args.audio),
+            ("-ns", not args.subtitles),
+            ("--use-video-length", args.use_video_length),
+            ("--animate-text", args.animate_text),
+            ("--no-bg-box", not args.bg_box),
+            ("--burn-subtitles", args.burn_subtitles),
+        ]
+        cmd_parts += [flag for flag, enabled in flags if enabled]
         
-        # Join command parts
+        # Quote for the shell the command will be run in, then join
+        if os.name == 'nt':
+            cmd_parts = [subprocess.list2cmdline([part]) for part in cmd_parts]
+        else:
+            cmd_parts = [shlex.quote(part) for part in cmd_parts]
         command = " ".join(cmd_parts)
         
         # Show export window
@@ -2051,162 +3093,155 @@ class ShortMakerGUI:
         if len(cmd_parts) <= 5:
             return " ".join(cmd_parts)
         
-        # Multi-line format for long commands
-        result = cmd_parts[0] + " " + cmd_parts[1]  # python short-maker.py
-        
-        # Add main video file
-        if len(cmd_parts) > 2:
-            result += " " + cmd_parts[2]
-            
-        # Add secondary video if present
-        if len(cmd_parts) > 3 and not cmd_parts[3].startswith('-'):
-            result += " " + cmd_parts[3]
-            start_idx = 4
-        else:
-            start_idx = 3
-        
-        # Add other parameters with line breaks
-        i = start_idx
-        while i < len(cmd_parts):
-            if cmd_parts[i].startswith('-'):
-                result += " \\\n    " + cmd_parts[i]
-                # Add parameter value if it exists and doesn't start with -
-                if i + 1 < len(cmd_parts) and not cmd_parts[i + 1].startswith('-'):
-                    result += " " + cmd_parts[i + 1]
-                    i += 2
-                else:
-                    i += 1
-            else:
-                result += " " + cmd_parts[i]
-                i += 1
+        # Multi-line format for long commands: script and media files on the first
+        # line, then each option with its value on its own line
+        lines = [[]]
+        for index, part in enumerate(cmd_parts):
+            if index > 2 and part.startswith('-'):
+                lines.append([])
+            lines[-1].append(part)
         
-        return result
+        return " \\\n    ".join(" ".join(line) for line in lines)
             
     def create_video(self):
         """Create video with current settings"""
+        # Read every setting once on the Tk thread (each variable get is a Tcl round-trip)
+        args = self.create_args_object()
+        
         # Validate required fields
-        if not self.top_video_var.get():
+        if not args.top_video:
             messagebox.showerror("Error", "Please select a main video file!")
             return
             
-        # Validate main media files exist
-        try:
-            top_files = parse_media_input(self.top_video_var.get())
-            if not top_files:
-                messagebox.showerror("Error", "No valid main media files found!")
-                return
-            
-            # Check if all files exist
-            missing_files = [f for f in top_files if not os.path.exists(f)]
-            if missing_files:
-                messagebox.showerror("Error", f"Main media files not found:\n" + "\n".join(missing_files))
-                return
-        except Exception as e:
-            messagebox.showerror("Error", f"Error parsing main media input: {str(e)}")
-            return
-            
-        # Validate secondary media files if provided
-        if self.bottom_video_var.get():
+        # Rescan media inputs in case files or directories changed since the last run
+        scan_media_input.cache_clear()
+        get_decode_resolution.cache_clear()
+        
+        # Start processing in a separate thread to avoid freezing GUI
+        
+        # Media inputs are checked on the worker thread, since directory scans and
+        # existence checks can be slow on network drives; returns an error message or None
+        def validate_media():
             try:
-                bottom_files = parse_media_input(self.bottom_video_var.get())
-                missing_files = [f for f in bottom_files if not os.path.exists(f)]
-                if missing_files:
-                    messagebox.showerror("Error", f"Secondary media files not found:\n" + "\n".join(missing_files))
-                    return
+                top_files = parse_media_input(args.top_video)
+                # (parse_media_input has already checked that every file exists)
+                if not top_files:
+                    return "No valid main media files found!"
             except Exception as e:
-                messagebox.showerror("Error", f"Error parsing secondary media input: {str(e)}")
-                return
+                return f"Error parsing main media input: {str(e)}"
             
-        # Start processing in a separate thread to avoid freezing GUI
-        import threading
+            # Validate secondary media files if provided
+            if args.bottom_video:
+                try:
+                    parse_media_input(args.bottom_video)
+                except Exception as e:
+                    return f"Error parsing secondary media input: {str(e)}"
+            return None
         
         def process_video():
+            error = validate_media()
+            if error:
+                # Message boxes must be opened from the Tk thread
+                self.root.after(0, lambda: messagebox.showerror("Error", error))
+                return
+            
             try:
-                self.progress_var.set("Processing video...")
-                self.progress_bar.start()
+                self.post_progress("Processing video...")
+                self.root.after(0, self.progress_bar.start)
                 
-                # Create arguments object similar to argparse
-                args = self.create_args_object()
+                # Usually already imported in the background after startup
+                load_video_backend()
                 
-                # Create video
-                video_clip = create_video_short(args)
-                
-                # Add narration if text file is provided
-                if args.text and os.path.exists(args.text):
-                    final_clip, tts_temp_files = add_narration(video_clip, args)
+                # Plain compositions (no narration or transitions) are rendered by FFmpeg alone
+                if can_render_with_ffmpeg(args):
+                    self.post_progress("Exporting video...")
+                    render_composition_ffmpeg(args)
                 else:
-                    final_clip = video_clip
-                    tts_temp_files = []
-                
-                # Export video
-                self.progress_var.set("Exporting video...")
-                final_clip.write_videofile(
-                    args.output,
-                    fps=30,
-                    codec="libx264",
-                    audio_codec="aac",
-                    threads=4,
-                    preset="fast",
-                    ffmpeg_params=["-crf", "23"]
-                )
-                
-                # Cleanup
-                if video_clip:
-                    video_clip.close()
-                if final_clip:
-                    final_clip.close()
-                for temp_file in tts_temp_files:
-                    if os.path.exists(temp_file):
+                    video_clip = None
+                    final_clip = None
+                    narration_future = None
+                    subtitle_file = None
+                    
+                    # Narration audio lives in a scratch directory removed automatically
+                    # (after the run's cached media clips are closed)
+                    with create_work_dir() as work_dir, create_media_cache() as media_cache:
                         try:
-                            os.remove(temp_file)
-                        except Exception:
-                            pass
+                            # Start narration synthesis while the video is composed
+                            has_narration = args.text and os.path.exists(args.text)
+                            if has_narration:
+                                narration_future = prefetch_narration(args, work_dir)
+                        
+                            # Create video
+                            video_clip = create_video_short(args, work_dir, media_cache)
+                        
+                            # Add narration if text file is provided
+                            if has_narration:
+                                final_clip, subtitle_file = add_narration(video_clip, args, work_dir, narration_future, media_cache)
+                            else:
+                                final_clip = video_clip
+                        
+                            # Export video
+                            self.post_progress("Exporting video...")
+                            export_video(final_clip, args.output, work_dir, show_progress=False, hwaccel=args.hwaccel,
+                                         subtitle_file=subtitle_file)
+                        finally:
+                            # Cleanup resources (let a pending prefetch finish before the directory is removed)
+                            if narration_future is not None:
+                                wait([narration_future])
+                            if video_clip:
+                                video_clip.close()
+                            if final_clip:
+                                final_clip.close()
                 
-                self.progress_bar.stop()
-                self.progress_var.set("Video created successfully!")
-                messagebox.showinfo("Success", f"Video saved as: {args.output}")
+                self.root.after(0, self.progress_bar.stop)
+                self.post_progress("Video created successfully!")
+                self.root.after(0, lambda: messagebox.showinfo("Success", f"Video saved as: {args.output}"))
                 
             except Exception as e:
-                self.progress_bar.stop()
-                self.progress_var.set("Error occurred during processing")
-                messagebox.showerror("Error", f"An error occurred: {str(e)}")
+                message = f"An error occurred: {str(e)}"
+                self.root.after(0, self.progress_bar.stop)
+                self.post_progress("Error occurred during processing")
+                self.root.after(0, lambda: messagebox.showerror("Error", message))
                 
         thread = threading.Thread(target=process_video)
         thread.daemon = True
         thread.start()
         
+    def post_progress(self, message):
+        """Show a progress message; safe to call from the worker thread"""
+        # Tkinter is not thread-safe, so the update runs on the Tk event loop
+        self.root.after(0, self.progress_var.set, message)
+        
     def create_args_object(self):
-        """Create an arguments object from GUI settings"""
-        class Args:
-            pass
-            
-        args = Args()
-        args.top_video = self.top_video_var.get()
-        args.bottom_video = self.bottom_video_var.get() if self.bottom_video_var.get() else None
-        args.music = self.music_var.get() if self.music_var.get() else None
-        args.text = self.text_var.get() if self.text_var.get() else None
-        args.output = self.output_var.get()
-        args.resolution = self.resolution_var.get()
-        args.lang = self.lang_var.get()
-        args.music_volume = self.music_volume_var.get()
-        args.video_volume = self.video_volume_var.get()
-        args.speed = self.speed_var.get()
-        args.fade_duration = self.fade_duration_var.get()
-        args.duck_volume = self.duck_volume_var.get() if self.duck_enabled_var.get() else None
-        args.text_color = self.text_color_var.get()
-        args.text_border_color = self.text_border_color_var.get()
-        args.audio = self.audio_var.get()
-        args.subtitles = self.subtitles_var.get()
-        args.use_video_length = self.use_video_length_var.get()
-        args.animate_text = self.animate_text_var.get()
-        args.bg_box = self.bg_box_var.get()
-        args.image_duration = self.image_duration_var.get()
-        args.transition_type = self.transition_type_var.get()
-        args.transition_duration = self.transition_duration_var.get()
-        args.start_transition = self.start_transition_var.get()
-        args.end_transition = self.end_transition_var.get()
-        
-        return args
+        """Create an arguments object from GUI settings (same type as the parsed CLI arguments)"""
+        return argparse.Namespace(
+            top_video=self.top_video_var.get(),
+            bottom_video=self.bottom_video_var.get() or None,
+            music=self.music_var.get() or None,
+            text=self.text_var.get() or None,
+            output=self.output_var.get(),
+            resolution=self.resolution_var.get(),
+            hwaccel=self.hwaccel_var.get() if self.hwaccel_var.get() != "none" else None,
+            lang=self.lang_var.get(),
+            music_volume=self.music_volume_var.get(),
+            video_volume=self.video_volume_var.get(),
+            speed=self.speed_var.get(),
+            fade_duration=self.fade_duration_var.get(),
+            duck_volume=self.duck_volume_var.get() if self.duck_enabled_var.get() else None,
+            text_color=self.text_color_var.get(),
+            text_border_color=self.text_border_color_var.get(),
+            audio=self.audio_var.get(),
+            subtitles=self.subtitles_var.get(),
+            use_video_length=self.use_video_length_var.get(),
+            animate_text=self.animate_text_var.get(),
+            bg_box=self.bg_box_var.get(),
+            burn_subtitles=self.burn_subtitles_var.get(),
+            image_duration=self.image_duration_var.get(),
+            transition_type=self.transition_type_var.get(),
+            transition_duration=self.transition_duration_var.get(),
+            start_transition=self.start_transition_var.get(),
+            end_transition=self.end_transition_var.get()
+        )
 
 def launch_gui():
     """Launch the graphical user interface"""
@@ -2391,6 +3426,8 @@ def main():
     parser.add_argument('-o', '--output', help='Output filename', default='output.mp4')
     parser.add_argument('-r', '--resolution', help='Target resolution WIDTHxHEIGHT', 
                       default='1080x1920')
+    parser.add_argument('--hwaccel', choices=HARDWARE_ENCODERS, default=None,
+                      help='Encode with a hardware H.264 encoder instead of libx264')
     parser.add_argument('-mv', '--music-volume', type=float,
                       help='Music volume (0-100%)', default=100.0)
     parser.add_argument('-a', '--audio', action='store_true',
@@ -2400,15 +3437,15 @@ def main():
     parser.add_argument('--image-duration', type=float, default=5.0,
                       help='Default duration for image files in seconds (ignored if narration is used)')
     parser.add_argument('--transition-type', type=str, default='none',
-                      choices=['none', 'fade', 'slide_left', 'slide_right', 'slide_up', 'slide_down', 'zoom_in', 'zoom_out'],
+                      choices=TRANSITION_TYPES,
                       help='Transition effect between multiple media files')
     parser.add_argument('--transition-duration', type=float, default=0.5,
                       help='Duration of transition effects in seconds')
     parser.add_argument('--start-transition', type=str, default='none',
-                      choices=['none', 'fade', 'slide_left', 'slide_right', 'slide_up', 'slide_down', 'zoom_in', 'zoom_out'],
+                      choices=TRANSITION_TYPES,
                       help='Transition effect at the start of video (fade recommended)')
     parser.add_argument('--end-transition', type=str, default='none',
-                      choices=['none', 'fade', 'slide_left', 'slide_right', 'slide_up', 'slide_down', 'zoom_in', 'zoom_out'],
+                      choices=TRANSITION_TYPES,
                       help='Transition effect at the end of video (fade recommended)')
 
     # Narration arguments
@@ -2430,6 +3467,8 @@ def main():
                         help='Text color for subtitles (name or hex code)')
     parser.add_argument('--no-bg-box', action='store_false', dest='bg_box',
                         help='Disable semi-transparent background box behind text')
+    parser.add_argument('--burn-subtitles', action='store_true',
+                        help='Draw subtitles with FFmpeg/libass while encoding (faster than compositing in MoviePy)')
     parser.add_argument('--text-border-color', type=str, default='black',
                         help='Add border/shadow to text using specified color')
 
@@ -2456,42 +3495,45 @@ def main():
     if args.fade_duration < 0:
         raise ValueError("Fade duration must be greater than or equal to 0")
 
-    tts_temp_files = []
+    load_video_backend()
+
+    # Plain compositions (no narration or transitions) are rendered by FFmpeg alone
+    if can_render_with_ffmpeg(args):
+        render_composition_ffmpeg(args)
+        return
+
     video_clip = None
     final_clip = None
+    narration_future = None
+    subtitle_file = None
 
-    try:
-        # Create video composition
-        video_clip = create_video_short(args)
-        
-        # Add narration if requested
-        if args.text:
-            final_clip, tts_temp_files = add_narration(video_clip, args)
-        else:
-            final_clip = video_clip
+    # Narration audio lives in a scratch directory that is removed automatically
+    # (after the run's cached media clips are closed)
+    with create_work_dir() as work_dir, create_media_cache() as media_cache:
+        try:
+            # Start narration synthesis in the background while the video is composed
+            if args.text:
+                narration_future = prefetch_narration(args, work_dir)
 
-        # Export final video
-        final_clip.write_videofile(
-            args.output,
-            fps=30,
-            codec="libx264",
-            audio_codec="aac",
-            threads=4,
-            preset="fast",
-            ffmpeg_params=["-crf", "23"]
-        )
-    finally:
-        # Cleanup resources
-        if video_clip:
-            video_clip.close()
-        if final_clip:
-            final_clip.close()
-        for temp_file in tts_temp_files:
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except Exception as e:
-                    print(f"Error deleting temporary file: {e}")
+            # Create video composition
+            video_clip = create_video_short(args, work_dir, media_cache)
+            
+            # Add narration if requested
+            if args.text:
+                final_clip, subtitle_file = add_narration(video_clip, args, work_dir, narration_future, media_cache)
+            else:
+                final_clip = video_clip
+
+            # Export final video
+            export_video(final_clip, args.output, work_dir, hwaccel=args.hwaccel, subtitle_file=subtitle_file)
+        finally:
+            # Cleanup resources (let a pending prefetch finish before the directory is removed)
+            if narration_future is not None:
+                wait([narration_future])
+            if video_clip:
+                video_clip.close()
+            if final_clip:
+                final_clip.close()
 
 if __name__ == "__main__":
     """